@@ -5,13 +5,15 @@ Enhanced with AI Summarization, Sentiment Analysis, Rich Console, and more!
 """
 
 import csv
+import gzip
 import json
 import argparse
 import sys
 import os
 import time
-import difflib
 import hashlib
+import importlib.util
+import random
 import warnings
 import logging
 import urllib.parse
@@ -19,29 +21,59 @@ import re
 from datetime import datetime, timedelta
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import sqlite3
+import zlib
+import difflib
+import asyncio
+import atexit
+import multiprocessing
+from collections import OrderedDict, defaultdict, namedtuple
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Union
 
 # Third Party Libraries
 from dateutil import parser
 from ddgs import DDGS
 import trafilatura
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Async HTTP (optional, falls back to the thread pool)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from dotenv import load_dotenv
 # Lazy load pyperclip (may fail on Termux/headless systems)
 pyperclip = None
 PYPERCLIP_AVAILABLE = False
 
-# YAML Support for Prompts
+# Fast fuzzy matching for title dedup (optional)
 try:
-    import yaml
-    YAML_AVAILABLE = True
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
 except ImportError:
-    YAML_AVAILABLE = False
+    RAPIDFUZZ_AVAILABLE = False
+
+# Fast JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# YAML Support for Prompts (imported when the prompt file is first needed)
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 # Rich Console
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -56,20 +88,25 @@ try:
 except ImportError:
     GROQ_AVAILABLE = False
 
+# Heavy SDKs below are only probed here and imported on first use, so meta commands
+# (--help, --clear-cache) and runs that never touch them skip the import cost
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
 except ImportError:
     GEMINI_AVAILABLE = False
+genai = None
 
 try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    VADER_AVAILABLE = True
 except ImportError:
-    TEXTBLOB_AVAILABLE = False
+    VADER_AVAILABLE = False
+
+TEXTBLOB_AVAILABLE = importlib.util.find_spec("textblob") is not None
 
 # Deep Translator
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import BaseError as TranslatorError
 
 # --- Load Environment Variables ---
 load_dotenv()
@@ -79,6 +116,10 @@ MAX_RETRIES = 3
 RETRY_DELAY = 2
 MAX_THREADS = 10
 TIMEOUT_SECONDS = 15
+AI_BATCH_SIZE = 5      # Articles per batched AI request
+AI_BATCH_WORKERS = 3   # Parallel batch requests (keep under provider RPM limit)
+TRANSLATE_WORKERS = 4  # Parallel translation requests (Google throttles bursts)
+EXTRACT_PROCESSES = os.cpu_count() or 1  # Worker processes for trafilatura.extract
 OUTPUT_DIR = "reports"
 CACHE_DIR = ".cache"
 CACHE_TTL_HOURS = 1
@@ -92,6 +133,20 @@ GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-lite")
 
+@lru_cache(maxsize=None)
+def _groq_client() -> Optional[Any]:
+    """Shared Groq client, built on first use (thread-safe, reuses its HTTP connection pool)."""
+    return Groq(api_key=GROQ_API_KEY) if GROQ_AVAILABLE and GROQ_API_KEY else None
+
+@lru_cache(maxsize=None)
+def _gemini_model(model_name: str) -> Any:
+    """Shared Gemini model per name (configured once, reused across calls and threads)."""
+    global genai
+    if genai is None:
+        import google.generativeai as genai
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(model_name)
+
 # Popular model presets for interactive picker
 GROQ_MODELS = [
     "llama-3.3-70b-versatile",
@@ -156,13 +211,49 @@ console = Console()
 IS_TERMUX = bool(os.environ.get('TERMUX_VERSION') or 
                  (os.environ.get('PREFIX', '').startswith('/data/data/com.termux')))
 
+# --- HTTP Session ---
+# Modern User-Agent headers
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
+    "Referer": "https://www.google.com/",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "cross-site",
+    "Sec-Fetch-User": "?1"
+}
+
+# Shared pooled session: worker threads reuse keep-alive connections instead of
+# paying a fresh TCP+TLS handshake per article
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_THREADS,
+    pool_maxsize=MAX_THREADS * 2,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 # --- Prompt Loader ---
 class PromptLoader:
     """Handles loading and formatting of prompts from YAML file."""
     
     def __init__(self, filepath: str = PROMPT_FILE) -> None:
         self.filepath: str = filepath
-        self.prompts: dict[str, Any] = self._load_prompts()
+        self._prompts: Optional[dict[str, Any]] = None
+
+    @property
+    def prompts(self) -> dict[str, Any]:
+        # Parsed on first use: runs without AI never import yaml or read the file
+        if self._prompts is None:
+            self._prompts = self._load_prompts()
+        return self._prompts
 
     def _load_prompts(self) -> dict[str, Any]:
         if not YAML_AVAILABLE:
@@ -173,6 +264,7 @@ class PromptLoader:
             console.print(f"[yellow]Warning: {self.filepath} not found. Using internal defaults.[/yellow]")
             return {}
             
+        import yaml
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f) or {}
@@ -193,62 +285,289 @@ class PromptLoader:
 prompt_loader = PromptLoader()
 
 # --- Cache Manager ---
+# Cache key hashing: no cryptographic property needed, so prefer the fastest available
+try:
+    from blake3 import blake3 as _blake3
+    def _hash_key(key: str) -> str:
+        return _blake3(key.encode()).hexdigest()[:32]
+except ImportError:
+    try:
+        import xxhash
+        def _hash_key(key: str) -> str:
+            return xxhash.xxh3_128(key.encode()).hexdigest()
+    except ImportError:
+        def _hash_key(key: str) -> str:
+            return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+MEMORY_CACHE_SIZE = 256  # Hot entries served from memory without touching SQLite
+WRITE_BATCH_SIZE = 8     # Buffered writes are committed in batches
+COMPRESS_MIN_BYTES = 1024  # Payloads this large are zlib-compressed on disk (article texts)
+
+# Bit flags in the `is_json` column (older rows only ever hold 0 or 1)
+_FLAG_JSON = 1
+_FLAG_ZLIB = 2
+
 class CacheManager:
-    """Simple file-based cache system."""
+    """Cache with TTL: in-memory LRU in front of a single SQLite file (WAL mode).
+
+    Strings are stored as raw UTF-8 text, everything else as JSON; large
+    payloads are zlib-compressed. Expired rows are pruned when the DB is first opened.
+    """
     
     def __init__(self) -> None:
         self.cache_dir: Path = Path(CACHE_DIR)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.ttl_seconds: float = CACHE_TTL_HOURS * 3600
+        
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._pending: list[tuple[str, float, bytes, int]] = []
+        
+        self._conn: Optional[sqlite3.Connection] = None
+        atexit.register(self.flush)
     
-    def _get_hash(self, key: str) -> str:
-        return hashlib.sha256(key.encode()).hexdigest()
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock).
+
+        Deferred so that merely importing the module, as spawned extract
+        workers do, never touches the cache file.
+        """
+        if self._conn is None:
+            self.cache_dir.mkdir(exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_dir / "cache.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, cached_at REAL, content BLOB, is_json INTEGER)"
+            )
+            try:
+                with conn:
+                    conn.execute("DELETE FROM cache WHERE cached_at < ?", (time.time() - self.ttl_seconds,))
+            except sqlite3.Error:
+                pass  # pruning is housekeeping; a busy DB must not keep the cache closed
+            self._conn = conn
+        return self._conn
     
-    def get(self, key: str) -> Optional[Any]:
-        cache_file = self.cache_dir / f"{self._get_hash(key)}.json"
-        if not cache_file.exists():
-            return None
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+    def _get_hash(self, key: str) -> str:
+        return _hash_key(key)
+    
+    def _remember(self, hashed: str, cached_at: float, content: Any) -> None:
+        """Store in the in-memory LRU (caller holds the lock)."""
+        self._memory[hashed] = (cached_at, content)
+        self._memory.move_to_end(hashed)
+        if len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        # max_age (seconds) tightens the TTL for callers that need fresher data
+        hashed = self._get_hash(key)
+        now = time.time()
+        limit = self.ttl_seconds if max_age is None else min(max_age, self.ttl_seconds)
+        
+        with self._lock:
+            hit = self._memory.get(hashed)
+            if hit is not None:
+                if now - hit[0] < limit:
+                    self._memory.move_to_end(hashed)
+                    return hit[1]
+                if now - hit[0] < self.ttl_seconds:
+                    return None
+                del self._memory[hashed]
+            
+            try:
+                row = self._db.execute(
+                    "SELECT cached_at, content, is_json FROM cache WHERE key = ?", (hashed,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            
+            cached_at, raw, flags = row
             # Check TTL
-            cached_time = datetime.fromisoformat(data['cached_at'])
-            if datetime.now() - cached_time > timedelta(hours=CACHE_TTL_HOURS):
-                cache_file.unlink()
+            if now - cached_at >= self.ttl_seconds:
+                try:
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (hashed,))
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
+                return None
+            if now - cached_at >= limit:
                 return None
-            return data['content']
-        except (json.JSONDecodeError, KeyError, OSError):
-            return None
+            
+            try:
+                if flags & _FLAG_ZLIB:
+                    raw = zlib.decompress(raw)
+                if flags & _FLAG_JSON:
+                    content = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                else:
+                    content = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+            except (json.JSONDecodeError, UnicodeDecodeError, zlib.error):
+                return None
+            
+            self._remember(hashed, cached_at, content)
+            return content
     
     def set(self, key: str, content: Any) -> None:
-        cache_file = self.cache_dir / f"{self._get_hash(key)}.json"
+        hashed = self._get_hash(key)
+        cached_at = time.time()
+        is_json = not isinstance(content, str)
+        
+        try:
+            if not is_json:
+                raw = content.encode('utf-8')
+            elif ORJSON_AVAILABLE:
+                raw = orjson.dumps(content)
+            else:
+                raw = json.dumps(content).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+        flags = _FLAG_JSON if is_json else 0
+        if len(raw) >= COMPRESS_MIN_BYTES:
+            raw = zlib.compress(raw)
+            flags |= _FLAG_ZLIB
+        
+        with self._lock:
+            self._remember(hashed, cached_at, content)
+            self._pending.append((hashed, cached_at, raw, flags))
+            if len(self._pending) >= WRITE_BATCH_SIZE:
+                self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'cached_at': datetime.now().isoformat(),
-                    'content': content
-                }, f)
-        except OSError:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO cache (key, cached_at, content, is_json) VALUES (?, ?, ?, ?)",
+                    self._pending
+                )
+        except sqlite3.Error:
             pass
+        self._pending.clear()
+    
+    def flush(self) -> None:
+        """Write any buffered entries to disk."""
+        with self._lock:
+            self._flush_locked()
     
     def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM cache")
+            except sqlite3.Error:
+                pass
+        # Remove leftovers from the old one-file-per-entry cache
         for f in self.cache_dir.glob("*.json"):
             f.unlink()
 
 cache = CacheManager()
 
+SEEN_URLS_MAX = 50_000  # Watch-mode URL memory cap (oldest forgotten first)
+
+class SeenURLStore:
+    """Bounded set of already-reported URLs, persisted so a restarted watch skips them.
+    
+    URLs are kept as signed 64-bit blake2b digests (fits SQLite INTEGER PRIMARY KEY).
+    """
+    
+    def __init__(self, path: Path, max_size: int = SEEN_URLS_MAX) -> None:
+        self.max_size = max_size
+        self._pending: list[tuple[int, float]] = []
+        self._evicted: list[tuple[int]] = []
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS seen (h INTEGER PRIMARY KEY, seen_at REAL)")
+        rows = self._db.execute(
+            "SELECT h FROM seen ORDER BY seen_at DESC LIMIT ?", (max_size,)
+        ).fetchall()
+        # Oldest first, so LRU eviction order survives the reload
+        self._mem: OrderedDict[int, None] = OrderedDict.fromkeys(h for (h,) in reversed(rows))
+        if len(rows) == max_size:
+            with self._db:
+                self._db.execute("DELETE FROM seen WHERE h NOT IN (SELECT h FROM seen ORDER BY seen_at DESC LIMIT ?)", (max_size,))
+    
+    @staticmethod
+    def _hash(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b((url or '').encode(), digest_size=8).digest(), 'big', signed=True)
+    
+    def __contains__(self, url: str) -> bool:
+        h = self._hash(url)
+        if h in self._mem:
+            self._mem.move_to_end(h)
+            return True
+        return False
+    
+    def add(self, url: str) -> None:
+        h = self._hash(url)
+        self._mem[h] = None
+        self._mem.move_to_end(h)
+        if len(self._mem) > self.max_size:
+            evicted, _ = self._mem.popitem(last=False)
+            self._evicted.append((evicted,))
+        self._pending.append((h, time.time()))
+    
+    def flush(self) -> None:
+        """Persist additions (and evictions) made since the last flush."""
+        if not self._pending and not self._evicted:
+            return
+        try:
+            with self._db:
+                self._db.executemany("DELETE FROM seen WHERE h = ?", self._evicted)
+                self._db.executemany("INSERT OR REPLACE INTO seen (h, seen_at) VALUES (?, ?)", self._pending)
+        except sqlite3.Error:
+            pass
+        self._pending.clear()
+        self._evicted.clear()
+    
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
 # --- Internal AI Logic (Isolated) ---
 
+def _groq_stream_text(messages: list[dict[str, str]], temperature: float, max_tokens: int, max_chars: Optional[int] = None) -> str:
+    """Run a streaming Groq chat completion and return the collected text.
+
+    When `max_chars` is set, the stream is closed as soon as the output grows
+    past it (the caller truncates there anyway), so no further tokens are decoded.
+    """
+    stream = _groq_client().chat.completions.create(
+        model=GROQ_MODEL,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    parts: list[str] = []
+    total = 0
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content or ""
+            parts.append(piece)
+            total += len(piece)
+            if max_chars is not None and total > max_chars:
+                break
+    finally:
+        stream.close()
+    return "".join(parts)
+
 def _groq_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False) -> str:
     """Summarize text using Groq LLM (Original Logic)."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return ""
     
     if not text or len(text) < 100:
         return ""
     
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        truncated = text[:15000] if len(text) > 15000 else text
+        truncated = text[:15000]
         
         if for_twitter:
             system_prompt = prompt_loader.get('summary', 'twitter', 'system', default="You are a social media expert.")
@@ -266,17 +585,15 @@ def _groq_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False
             user_prompt = user_prompt_tpl.format(text=truncated)
             max_tokens = 1024
         
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[
+        result = _groq_stream_text(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.5,
-            max_tokens=max_tokens
-        )
-        
-        result = response.choices[0].message.content.strip()
+            max_tokens=max_tokens,
+            max_chars=2000 if for_twitter else None
+        ).strip()
         if for_twitter and len(result) > 2000:
             result = result[:1997] + "..."
         return result
@@ -293,10 +610,9 @@ def _gemini_summarize(text: str, max_sentences: int = 3, for_twitter: bool = Fal
         return ""
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
-        truncated = text[:100000] if len(text) > 100000 else text
+        truncated = text[:100000]
         
         if for_twitter:
             system_prompt = prompt_loader.get('summary', 'twitter', 'system', default="You are a social media expert.")
@@ -332,13 +648,13 @@ def _gemini_summarize(text: str, max_sentences: int = 3, for_twitter: bool = Fal
 
 def _groq_generate_combined(title: str, text: str, topic: str) -> dict:
     """Generate both summary and tweet in single Groq API call. Saves 50% quota."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return {"tweet": "", "summary": ""}
     
     try:
-        client = Groq(api_key=GROQ_API_KEY)
+        client = _groq_client()
         # Optimized: reduced from 15000 to 5000 chars
-        truncated = text[:5000] if len(text) > 5000 else text
+        truncated = text[:5000]
         
         system_prompt = prompt_loader.get('combined_generation', 'system', 
             default="Output JSON with 'tweet' and 'summary' keys.")
@@ -371,11 +687,10 @@ def _gemini_generate_combined(title: str, text: str, topic: str) -> dict:
         return {"tweet": "", "summary": ""}
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
         # Optimized: reduced from 30000 to 5000 chars
-        truncated = text[:5000] if len(text) > 5000 else text
+        truncated = text[:5000]
         
         system_prompt = prompt_loader.get('combined_generation', 'system', 
             default="Output JSON with 'tweet' and 'summary' keys.")
@@ -409,21 +724,21 @@ def _gemini_generate_combined(title: str, text: str, topic: str) -> dict:
         console.print(f"[red]❌ Gemini Combined error: {type(e).__name__}: {e}[/red]")
         return {"tweet": "", "summary": ""}
 
+# Markdown code fence around model JSON (closing fence optional: output may be cut off)
+_JSON_FENCE = re.compile(r"```(?:json)?(.*?)(?:```|$)", re.DOTALL)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _strip_json_fence(raw_output: str) -> str:
+    match = _JSON_FENCE.search(raw_output)
+    return (match.group(1) if match else raw_output).strip()
+
 def _parse_combined_json(raw_output: str) -> dict:
     """Parse JSON from AI response with fallback handling."""
-    import json
-    
-    # Clean markdown code blocks if present
-    cleaned = raw_output
-    if "```json" in cleaned:
-        cleaned = cleaned.split("```json")[1].split("```")[0]
-    elif "```" in cleaned:
-        cleaned = cleaned.split("```")[1].split("```")[0]
-    
-    cleaned = cleaned.strip()
+    cleaned = _strip_json_fence(raw_output)
     
     try:
-        data = json.loads(cleaned)
+        data = _json_loads(cleaned)
         tweet = data.get("tweet", "").strip().replace('**', '').replace('__', '')
         summary = data.get("summary", "").strip()
         
@@ -445,30 +760,156 @@ def ai_generate_combined(title: str, text: str, topic: str, provider: str = None
     else:
         return _groq_generate_combined(title, text, topic)
 
+# --- Batch Generation (Summary + Tweet for several articles in one call) ---
+
+def _build_batch_prompts(items: list[dict]) -> tuple[str, str]:
+    """Build system/user prompts for a numbered batch of articles."""
+    system_prompt = prompt_loader.get('batch_generation', 'system',
+        default="For each [ID n] article, output JSON {\"articles\": [{\"id\": n, \"tweet\": ..., \"summary\": ...}]}.")
+    user_prompt_tpl = prompt_loader.get('batch_generation', 'user', default="{articles}")
+
+    blocks = []
+    for item in items:
+        truncated = item['text'][:5000]
+        blocks.append(f"[ID {item['id']}]\nJudul: {item['title']}\n\nIsi berita:\n{truncated}")
+
+    user_prompt = user_prompt_tpl.format(articles="\n\n---\n\n".join(blocks))
+    return system_prompt, user_prompt
+
+def _groq_generate_batch(items: list[dict]) -> dict:
+    """Generate summary + tweet for several articles in a single Groq API call."""
+    if _groq_client() is None:
+        return {}
+
+    client = _groq_client()
+    system_prompt, user_prompt = _build_batch_prompts(items)
+
+    response = client.chat.completions.create(
+        model=GROQ_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.6,
+        max_tokens=800 * len(items),
+        response_format={"type": "json_object"}
+    )
+
+    return _parse_batch_json(response.choices[0].message.content.strip())
+
+def _gemini_generate_batch(items: list[dict]) -> dict:
+    """Generate summary + tweet for several articles in a single Gemini API call."""
+    if not GEMINI_AVAILABLE or not GEMINI_API_KEY:
+        return {}
+
+    model = _gemini_model(GEMINI_MODEL)
+    system_prompt, user_prompt = _build_batch_prompts(items)
+
+    response = model.generate_content(
+        f"{system_prompt}\n\n{user_prompt}",
+        generation_config=genai.types.GenerationConfig(
+            temperature=0.6,
+            max_output_tokens=1024 * len(items),
+            response_mime_type="application/json"
+        )
+    )
+
+    if not response.text:
+        return {}
+    return _parse_batch_json(response.text.strip())
+
+def _parse_batch_json(raw_output: str) -> dict:
+    """Parse batch JSON response into {id: {"tweet", "summary"}}. Raises ValueError on bad JSON."""
+    data = _json_loads(_strip_json_fence(raw_output))
+    entries = data.get("articles", []) if isinstance(data, dict) else data
+
+    results = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or "id" not in entry:
+            continue
+        tweet = str(entry.get("tweet", "")).strip().replace('**', '').replace('__', '')
+        if len(tweet) > 2000:
+            tweet = tweet[:1997] + "..."
+        try:
+            results[int(entry["id"])] = {"tweet": tweet, "summary": str(entry.get("summary", "")).strip()}
+        except (TypeError, ValueError):
+            continue
+    return results
+
+def _ai_cache_key(model: str, topic: str, title: str, text: str) -> str:
+    """Cache key for a summary/tweet pair; CacheManager hashes it down to a fixed-size digest."""
+    return "\x00".join(("ai", model, topic, title, text))
+
+def ai_batch_process(news_list: list[dict[str, Any]], topic: str, batch_size: int = AI_BATCH_SIZE, provider: str = None) -> None:
+    """Fill ai_summary/ai_tweet for all articles using batched AI calls.
+
+    Articles are chunked into groups of `batch_size`, each group costs one API
+    call, and groups run in parallel (bounded by AI_BATCH_WORKERS). Articles a
+    batch fails to cover fall back to the per-article combined call.
+    """
+    target_provider = provider or AI_PROVIDER
+    batch_fn = _gemini_generate_batch if target_provider == "gemini" else _groq_generate_batch
+
+    model = GEMINI_MODEL if target_provider == "gemini" else GROQ_MODEL
+
+    # Articles already summarized (same model, topic and text) in this or an earlier run cost no call
+    pending = []
+    for i, item in enumerate(news_list, 1):
+        if not item.get('full_text'):
+            continue
+        key = _ai_cache_key(model, topic, item.get('title', ''), item['full_text'])
+        cached = cache.get(key)
+        if cached:
+            item['ai_summary'] = cached.get('summary', '')
+            item['ai_tweet'] = cached.get('tweet', '')
+        else:
+            pending.append({'id': i, 'title': item.get('title', ''), 'text': item['full_text'], 'key': key})
+    if not pending:
+        return
+
+    chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    def _run_chunk(chunk: list[dict]) -> None:
+        try:
+            results = batch_fn(chunk)
+        except Exception as e:
+            console.print(f"[dim]Batch AI error, falling back per article: {e}[/dim]")
+            results = {}
+
+        for entry in chunk:
+            item = news_list[entry['id'] - 1]
+            result = results.get(entry['id'])
+            if not result or not (result['tweet'] or result['summary']):
+                result = ai_generate_combined(entry['title'], entry['text'], topic, provider=target_provider)
+            item['ai_summary'] = result.get('summary', '')
+            item['ai_tweet'] = result.get('tweet', '')
+            if item['ai_summary'] or item['ai_tweet']:
+                cache.set(entry['key'], {'summary': item['ai_summary'], 'tweet': item['ai_tweet']})
+
+    with ThreadPoolExecutor(max_workers=AI_BATCH_WORKERS) as executor:
+        list(executor.map(_run_chunk, chunks))
+
 # --- Standalone Tweet Generation (for regenerate feature) ---
 
 def _groq_generate_tweet(title: str, text: str, topic: str) -> str:
     """Generate tweet using Groq (for regenerate only)."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return ""
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        truncated = text[:5000] if len(text) > 5000 else text
+        truncated = text[:5000]
         system_prompt = prompt_loader.get('tweet_generation', 'system', default="You are a twitter expert.")
         user_prompt_tpl = prompt_loader.get('tweet_generation', 'user', default="Title: {title}\nText: {text}")
         user_prompt = user_prompt_tpl.format(title=title, text=truncated)
 
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[
+        tweet_text = _groq_stream_text(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.6,
-            max_tokens=300
-        )
-        
-        tweet_text = response.choices[0].message.content.strip()
+            max_tokens=300,
+            max_chars=2000
+        ).strip()
         tweet_text = tweet_text.strip('"\'').replace('**', '').replace('__', '')
         if len(tweet_text) > 2000:
             tweet_text = tweet_text[:1997] + "..."
@@ -487,10 +928,9 @@ def _gemini_generate_tweet(title: str, text: str, topic: str) -> str:
         return ""
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
-        truncated = text[:30000] if len(text) > 30000 else text
+        truncated = text[:30000]
         
         # Load prompts with debug info
         system_prompt = prompt_loader.get('tweet_generation', 'system')
@@ -558,14 +998,22 @@ def ai_generate_tweet_text(title: str, text: str, topic: str, provider: str = No
         return _groq_generate_tweet(title, text, topic)
 
 # --- Sentiment Analysis ---
+@lru_cache(maxsize=None)
+def _vader() -> Any:
+    """Shared VADER analyzer; its lexicon is parsed on the first sentiment call."""
+    return SentimentIntensityAnalyzer()
+
 def analyze_sentiment(text: str) -> dict:
-    """Analyze sentiment of text."""
-    if not TEXTBLOB_AVAILABLE or not text:
+    """Analyze sentiment of text (VADER lexicon scan, TextBlob as fallback)."""
+    if not (VADER_AVAILABLE or TEXTBLOB_AVAILABLE) or not text:
         return {"label": "Unknown", "score": 0.0, "emoji": "❓"}
     
     try:
-        blob = TextBlob(text[:1000])  # Limit for performance
-        polarity = blob.sentiment.polarity
+        if VADER_AVAILABLE:
+            polarity = _vader().polarity_scores(text[:1000])['compound']
+        else:
+            from textblob import TextBlob
+            polarity = TextBlob(text[:1000]).sentiment.polarity
         
         if polarity > 0.1:
             return {"label": "Positif", "score": polarity, "emoji": "😊"}
@@ -578,9 +1026,42 @@ def analyze_sentiment(text: str) -> dict:
         return {"label": "Unknown", "score": 0.0, "emoji": "❓"}
 
 # --- Utility Functions ---
+_UNSAFE_FILENAME_CHARS = re.compile(r'\W')
+_ASCII_FILENAME_TABLE = bytes(c if chr(c).isalnum() else ord('_') for c in range(256))
+
+def safe_filename(text: str) -> str:
+    """Replace every non-alphanumeric character with '_' for use in report filenames."""
+    if text.isascii():
+        # Table lookup in one C pass; the regex is only needed for non-ASCII letters
+        return text.encode('ascii').translate(_ASCII_FILENAME_TABLE).decode('ascii')
+    return _UNSAFE_FILENAME_CHARS.sub('_', text)
+
+# Title of the stand-in item for a pasted URL until the page's own title is known
+URL_PLACEHOLDER_TITLE = 'URL Processing...'
+
+def is_direct_url(text: str) -> bool:
+    return text.startswith(('http://', 'https://'))
+
+def url_placeholder(url: str) -> dict[str, Any]:
+    """Single news item for a pasted URL; fetch_single_article fills in the real title."""
+    return {
+        'url': url,
+        'title': URL_PLACEHOLDER_TITLE,
+        'source': 'Direct Link',
+        'formatted_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'body': ''
+    }
+
+# Directories already created by this process (skips a makedirs syscall per save)
+_READY_DIRS: set[str] = set()
+
+def _ensure_dir(path: str) -> None:
+    if path not in _READY_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _READY_DIRS.add(path)
+
 def ensure_output_dir() -> None:
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    _ensure_dir(OUTPUT_DIR)
 
 def validate_url(url: str) -> bool:
     """Validate URL to prevent command injection in subprocess calls.
@@ -610,72 +1091,263 @@ def validate_url(url: str) -> bool:
     except (ValueError, AttributeError):
         return False
 
-def print_banner():
-    banner = """
+# Banner panel is built once and reused on every print
+_BANNER_PANEL = Panel(
+    """
 ╔══════════════════════════════════════════════════════════════╗
 ║     🚀 XNEWS - Smart News Fetcher Turbo v2.0                 ║
 ║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━      ║
 ║     ✨ AI Summarization • Sentiment Analysis • Rich UI       ║
 ╚══════════════════════════════════════════════════════════════╝
-    """
-    console.print(Panel(banner.strip(), style="bold cyan", box=box.DOUBLE))
+    """.strip(),
+    style="bold cyan",
+    box=box.DOUBLE
+)
+
+def print_banner():
+    console.print(_BANNER_PANEL)
+
+_TITLE_PUNCT = re.compile(r'\W+')
 
 def clean_title(title: str) -> str:
-    return title.lower().strip()
+    # Case and punctuation insensitive, so outlet styling doesn't defeat dedup
+    return _TITLE_PUNCT.sub(' ', title.lower()).strip()
+
+# --- Near-Duplicate Detection (MinHash + LSH) ---
+_SHINGLE_SIZE = 4
+_NUM_PERM = 64
+_LSH_BANDS = 16
+_LSH_ROWS = _NUM_PERM // _LSH_BANDS
+_HASH_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _HASH_PRIME), _rng.randrange(0, _HASH_PRIME)) for _ in range(_NUM_PERM)]
+
+def _minhash_signature(title: str) -> tuple[int, ...]:
+    """Compute a MinHash signature over character shingles of a title."""
+    shingles = {title[i:i + _SHINGLE_SIZE] for i in range(max(len(title) - _SHINGLE_SIZE + 1, 1))}
+    # crc32 rather than hash(): str hashing is salted per process, signatures must be stable
+    hashes = [zlib.crc32(sh.encode()) for sh in shingles]
+    return tuple(min((a * h + b) % _HASH_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+def title_ratio(a: str, b: str) -> float:
+    """Similarity of two cleaned titles on difflib's 0..1 scale (rapidfuzz's C++ Indel ratio if installed)."""
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(a, b) / 100
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+class TitleIndex:
+    """Near-duplicate title index using MinHash signatures with LSH banding.
+
+    Each lookup only compares against titles sharing at least one LSH band,
+    so dedup stays roughly linear instead of comparing every pair.
+    """
 
-def is_duplicate(news_item: dict[str, Any], existing_titles: set[str], threshold: float = 0.85) -> bool:
-    title = clean_title(news_item.get('title', ''))
-    if title in existing_titles:
-        return True
-    for existing in existing_titles:
-        if difflib.SequenceMatcher(None, title, existing).ratio() > threshold:
+    def __init__(self, threshold: float = 0.85) -> None:
+        self.threshold: float = threshold
+        self.exact: set[str] = set()
+        self.titles: list[str] = []
+        self.signatures: list[tuple[int, ...]] = []
+        self.buckets: defaultdict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+        self._last: tuple[str, tuple[int, ...]] = ("", ())
+
+    def _signature(self, title: str) -> tuple[int, ...]:
+        if self._last[0] != title or not self._last[1]:
+            self._last = (title, _minhash_signature(title))
+        return self._last[1]
+
+    @staticmethod
+    def _bands(sig: tuple[int, ...]):
+        for b in range(_LSH_BANDS):
+            yield (b, sig[b * _LSH_ROWS:(b + 1) * _LSH_ROWS])
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def is_duplicate(self, title: str) -> bool:
+        if title in self.exact:
             return True
-    return False
+        sig = self._signature(title)
+        candidates: set[int] = set()
+        for band in self._bands(sig):
+            candidates.update(self.buckets.get(band, ()))
+        # MinHash agreement runs well below difflib's ratio on retyped headlines (one inserted
+        # word), so it only picks candidates; the verdict stays on difflib's scale
+        return any(title_ratio(title, self.titles[idx]) > self.threshold for idx in candidates)
+
+    def add(self, title: str) -> None:
+        if title in self.exact:
+            return
+        self.exact.add(title)
+        sig = self._signature(title)
+        idx = len(self.signatures)
+        self.titles.append(title)
+        self.signatures.append(sig)
+        for band in self._bands(sig):
+            self.buckets[band].append(idx)
 
-def translate_text(text: str, target: str = 'id') -> str:
-    """Translate long text by splitting into paragraphs."""
-    if not text:
-        return ""
-    
-    translator = GoogleTranslator(source='auto', target=target)
-    translated_parts = []
-    paragraphs = text.split('\n')
+def is_duplicate(news_item: dict[str, Any], existing_titles: TitleIndex) -> bool:
+    return existing_titles.is_duplicate(clean_title(news_item.get('title', '')))
+
+_translator_local = threading.local()
+
+def get_translator(target: str = 'id') -> GoogleTranslator:
+    """Return a cached GoogleTranslator for `target`, one per thread.
+
+    GoogleTranslator mutates its request params on every call, so instances
+    are reused within a thread but never shared between worker threads.
+    """
+    translators = getattr(_translator_local, 'translators', None)
+    if translators is None:
+        translators = _translator_local.translators = {}
+    if target not in translators:
+        translators[target] = GoogleTranslator(source='auto', target=target)
+    return translators[target]
+
+# requests errors derive from OSError (not the builtin ConnectionError); deep_translator
+# raises its own BaseError subclasses. Either way the text stays untranslated.
+_TRANSLATE_ERRORS = (OSError, ValueError, TranslatorError)
+
+def translate_many(texts: list[str], target: str = 'id') -> list[str]:
+    """Translate many short texts with as few requests as possible.
+
+    Lines are packed into newline-joined requests of up to 4500 characters
+    and split back afterwards. If a packed response does not come back with
+    the same number of lines, that pack falls back to one request per line.
+    Packs are sent in parallel (bounded by TRANSLATE_WORKERS).
+    """
+    results = list(texts)
     
-    for p in paragraphs:
-        if not p.strip():
-            translated_parts.append("")
-            continue
+    def _translate_one(idx: int) -> None:
         try:
-            if len(p) > 4500:
-                res = translator.translate(p[:4500])
-            else:
-                res = translator.translate(p)
-            translated_parts.append(res)
-        except (ValueError, ConnectionError, TimeoutError) as e:
+            # Translators are thread-local, so fetch the one for this worker
+            results[idx] = get_translator(target).translate(texts[idx][:4500])
+        except _TRANSLATE_ERRORS as e:
             console.print(f"[dim]Translation skipped: {e}[/dim]")
-            translated_parts.append(p)
     
-    return "\n".join(translated_parts)
+    def _translate_pack(indices: list[int]) -> None:
+        if len(indices) == 1:
+            _translate_one(indices[0])
+            return
+        try:
+            joined = "\n".join(texts[i] for i in indices)
+            parts = (get_translator(target).translate(joined) or "").split("\n")
+        except _TRANSLATE_ERRORS:
+            parts = []
+        if len(parts) == len(indices):
+            for i, part in zip(indices, parts):
+                results[i] = part
+        else:
+            for i in indices:
+                _translate_one(i)
+    
+    jobs: list[list[int]] = []
+    pack = []
+    pack_len = 0
+    for idx, text in enumerate(texts):
+        if not text.strip():
+            continue
+        if "\n" in text or len(text) > 4500:
+            jobs.append([idx])
+            continue
+        if pack and pack_len + len(text) + 1 > 4500:
+            jobs.append(pack)
+            pack, pack_len = [], 0
+        pack.append(idx)
+        pack_len += len(text) + 1
+    if pack:
+        jobs.append(pack)
+    
+    if len(jobs) == 1:
+        _translate_pack(jobs[0])
+    elif jobs:
+        with ThreadPoolExecutor(max_workers=min(TRANSLATE_WORKERS, len(jobs))) as executor:
+            list(executor.map(_translate_pack, jobs))
+    
+    return results
+
+def translate_text(text: str, target: str = 'id') -> str:
+    """Translate long text by splitting into paragraphs."""
+    if not text:
+        return ""
+    return "\n".join(translate_many(text.split('\n'), target=target))
 
 def apply_translation(news_item: dict[str, Any], text: str, target: str = 'id') -> str:
     """Helper to translate title and text."""
-    try:
-        orig_title = news_item.get('title', '')
-        if orig_title:
-            news_item['title'] = GoogleTranslator(source='auto', target=target).translate(orig_title)
-    except (ValueError, ConnectionError, TimeoutError):
-        pass  # Keep original title on translation failure
-    return translate_text(text, target=target)
+    orig_title = news_item.get('title', '')
+    translated = translate_many([orig_title.replace('\n', ' ')] + text.split('\n'), target=target)
+    if orig_title:
+        news_item['title'] = translated[0]
+    return "\n".join(translated[1:])
+
+def translate_articles(news_list: list[dict[str, Any]], target: str = 'id') -> None:
+    """Translate titles and full texts of many articles in a few packed requests."""
+    items = [n for n in news_list if n.get('full_text')]
+    if not items:
+        return
+    
+    lines = []
+    spans = []
+    for item in items:
+        lines.append(item.get('title', '').replace('\n', ' '))
+        paragraphs = item['full_text'].split('\n')
+        spans.append((len(lines), len(lines) + len(paragraphs)))
+        lines.extend(paragraphs)
+    
+    translated = translate_many(lines, target=target)
+    for item, (start, end) in zip(items, spans):
+        if item.get('title'):
+            item['title'] = translated[start - 1]
+        item['full_text'] = "\n".join(translated[start:end])
+        item['is_translated'] = True
 
 # --- Article Fetching ---
+def download_html(url: str) -> bytes:
+    """Download raw HTML through the pooled session (b"" on failure)."""
+    try:
+        # SSL verification is enabled for security
+        resp = SESSION.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT_SECONDS, verify=True)
+        return resp.content if resp.ok else b""
+    except requests.exceptions.SSLError:
+        console.print(f"[dim]SSL Verify error for {url}. Switching to cURL fallback.[/dim]")
+    except (requests.RequestException, OSError) as e:
+        console.print(f"[dim]Layer 1 fetch error: {e}[/dim]")
+    return b""
+
+def extract_main_text(raw_html: Union[str, bytes]) -> str:
+    """Primary trafilatura extraction (module-level so it can run in a worker process).
+
+    Bytes go straight in (trafilatura detects the encoding); the slower
+    fallback extractors are skipped.
+    """
+    return trafilatura.extract(raw_html, include_comments=False, include_tables=False, no_fallback=True) or ""
+
+# Tag-free, length-bounded capture: malformed markup can't turn a page-sized run into the "title"
+_TITLE_TAG = re.compile(r'<title>([^<]{1,500})</title>', re.IGNORECASE)
+_TITLE_TAG_BYTES = re.compile(rb'<title>([^<]{1,500})</title>', re.IGNORECASE)
+
+def _html_title(html: Union[str, bytes]) -> str:
+    """Text of the page's <title> tag ("" if none), searched without decoding the whole page."""
+    match = (_TITLE_TAG_BYTES if isinstance(html, bytes) else _TITLE_TAG).search(html)
+    if not match:
+        return ""
+    title = match.group(1)
+    return title.decode('utf-8', errors='replace') if isinstance(title, bytes) else title
+
 def fetch_single_article(
     news_item: dict[str, Any], 
     auto_translate: bool = False, 
     do_summarize: bool = False, 
     do_sentiment: bool = False, 
-    topic: str = ""
+    topic: str = "",
+    raw_html: Optional[Union[str, bytes]] = None,
+    extracted_text: Optional[str] = None
 ) -> dict[str, Any]:
-    """Worker function: Download HTML -> Extract Text -> (Optional) Translate/Summarize/Sentiment/AI Tweet"""
+    """Worker function: Download HTML -> Extract Text -> (Optional) Translate/Summarize/Sentiment/AI Tweet
+
+    `raw_html` may carry HTML already downloaded by `enrich_news_content`; an
+    empty value means that download failed, so the session download is skipped.
+    `extracted_text` may carry the result of `extract_main_text` on it.
+    """
     url = news_item.get('url')
     news_item['full_text'] = ""
     news_item['is_translated'] = False
@@ -691,71 +1363,40 @@ def fetch_single_article(
     if cached:
         news_item['full_text'] = cached
     else:
-        # Modern User-Agent headers
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
-            "Referer": "https://www.google.com/",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "cross-site",
-            "Sec-Fetch-User": "?1"
-        }
-        
-        extracted_text = ""
-        
-        # --- LAYER 1: Trafilatura Native Fetch ---
-        try:
-            raw_html = trafilatura.fetch_url(url)
-            if raw_html:
-                extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
-        except (requests.RequestException, OSError) as e:
-            console.print(f"[dim]Layer 1 fetch error: {e}[/dim]")
-            
-        # If Layer 1 failed to produce meaningful text, try Layer 2
-        # --- LAYER 2: Requests Library (Better Headers) ---
-        if not extracted_text or len(extracted_text) < 200:
-            try:
-                # SSL verification is enabled for security
-                response = requests.get(url, headers=headers, timeout=TIMEOUT_SECONDS, verify=True)
-                if response.status_code == 200:
-                    raw_html = response.text
-                    extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
-            except requests.exceptions.SSLError:
-                # Log SSL error but continue to Layer 3 (cURL) which might handle it differently
-                console.print(f"[dim]SSL Verify error for {url}. Switching to Layer 3 fallback.[/dim]")
-            except (requests.RequestException, OSError) as e:
-                console.print(f"[dim]Layer 2 fetch error: {e}[/dim]")
-
-        # If Layer 2 also failed, try Layer 3
-        # --- LAYER 3: System cURL (Linux/Termux Superpower) ---
+        # --- LAYER 1: Pooled Session (unless already downloaded/extracted) ---
+        if raw_html is None:
+            raw_html = download_html(url)
+        if raw_html and extracted_text is None:
+            extracted_text = extract_main_text(raw_html)
+
+        # If Layer 1 failed, try Layer 2
+        # --- LAYER 2: System cURL (Linux/Termux Superpower) ---
         # Bypasses many TLS Fingerprint blocks that Python requests fail on
         if (not extracted_text or len(extracted_text) < 200) and shutil.which("curl") and validate_url(url):
             try:
                 cmd = [
                     "curl", "-s", "-L", 
-                    "-A", headers["User-Agent"],
+                    "-A", DEFAULT_HEADERS["User-Agent"],
                     "--max-time", str(TIMEOUT_SECONDS),
                     url
                 ]
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+                # Raw bytes: trafilatura detects the page encoding itself, no forced UTF-8 decode
+                result = subprocess.run(cmd, capture_output=True)
                 if result.returncode == 0 and len(result.stdout) > 500: # Ensure we got substantial data
                     raw_html = result.stdout
                     extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
             except (subprocess.SubprocessError, OSError) as e:
-                console.print(f"[dim]Layer 3 cURL error: {e}[/dim]")
+                console.print(f"[dim]Layer 2 cURL error: {e}[/dim]")
         
         # Use whatever raw_html we have for metadata fallback if text extraction failed but we have HTML
-        downloaded = locals().get('raw_html', None)
+        downloaded = raw_html
         
         # Fallback to snippet body if extraction failed completely
         if not extracted_text:
             extracted_text = news_item.get('body', '')
         
         # If we have downloaded content but no title (direct URL case), try to extract metadata
-        if downloaded and news_item.get('title') == 'URL Processing...':
+        if downloaded and news_item.get('title') == URL_PLACEHOLDER_TITLE:
             try:
                 metadata = trafilatura.bare_extraction(downloaded)
                 if metadata:
@@ -769,11 +1410,10 @@ def fetch_single_article(
                 pass  # Metadata extraction is optional
         
         # Fallback: Extract title from <title> tag using regex if trafilatura failed
-        if news_item.get('title') == 'URL Processing...' and downloaded:
-             import re
-             match = re.search(r'<title>(.*?)</title>', downloaded, re.IGNORECASE)
-             if match:
-                 news_item['title'] = match.group(1).split('|')[0].strip() # Take first part before pipe
+        if news_item.get('title') == URL_PLACEHOLDER_TITLE and downloaded:
+             page_title = _html_title(downloaded)
+             if page_title:
+                 news_item['title'] = page_title.split('|')[0].strip() # Take first part before pipe
 
         news_item['full_text'] = extracted_text
         
@@ -785,28 +1425,21 @@ def fetch_single_article(
     text_to_process = news_item['full_text']
     
     if text_to_process:
-        # Translation
-        if auto_translate:
-            news_item['full_text'] = apply_translation(news_item, text_to_process, target='id')
-            news_item['is_translated'] = True
-            text_to_process = news_item['full_text']
-        
-        # If title is still placeholder (even after trans), try to generate/fix it using AI or first sentence
-        current_title = news_item.get('title', '')
-        if 'URL Processing' in current_title or 'Pemrosesan URL' in current_title:
+        # If title is still the placeholder, generate it with AI before any translation, so
+        # the new title is translated with the text (here or in translate_articles afterwards)
+        if news_item.get('title') == URL_PLACEHOLDER_TITLE:
              # Use AI to generate title from text
              if (AI_PROVIDER == "groq" and GROQ_API_KEY) or (AI_PROVIDER == "gemini" and GEMINI_API_KEY):
                  def _try_gen_title(prov):
                     try:
                         if prov == "gemini" and GEMINI_API_KEY:
-                            genai.configure(api_key=GEMINI_API_KEY)
-                            model = genai.GenerativeModel(GEMINI_MODEL)
+                            model = _gemini_model(GEMINI_MODEL)
                             user_prompt_tpl = prompt_loader.get('title_generation', 'user', default="Create title from:\n\n{text}")
                             user_prompt = user_prompt_tpl.format(text=text_to_process[:500])
                             t_resp = model.generate_content(user_prompt, generation_config={"max_output_tokens": 100})
                             return t_resp.text.strip().strip('"')
-                        elif prov == "groq" and GROQ_API_KEY:
-                            client = Groq(api_key=GROQ_API_KEY)
+                        elif prov == "groq" and _groq_client() is not None:
+                            client = _groq_client()
                             user_prompt_tpl = prompt_loader.get('title_generation', 'user', default="Create title from:\n\n{text}")
                             user_prompt = user_prompt_tpl.format(text=text_to_process[:500])
                             t_resp = client.chat.completions.create(
@@ -823,6 +1456,12 @@ def fetch_single_article(
                  if new_title:
                     news_item['title'] = new_title
 
+        # Translation
+        if auto_translate:
+            news_item['full_text'] = apply_translation(news_item, text_to_process, target='id')
+            news_item['is_translated'] = True
+            text_to_process = news_item['full_text']
+        
         # AI Summarization + Tweet (Combined in single API call for efficiency)
         if do_summarize and ((AI_PROVIDER == "groq" and GROQ_API_KEY) or (AI_PROVIDER == "gemini" and GEMINI_API_KEY)):
             title = news_item.get('title', '')
@@ -839,6 +1478,149 @@ def fetch_single_article(
     
     return news_item
 
+def _needs_download(news_item: dict[str, Any]) -> bool:
+    """True for a valid article URL whose text is not cached yet."""
+    url = news_item.get('url')
+    return bool(url) and url.startswith(('http://', 'https://')) and not cache.get(url)
+
+async def _download_all_async(
+    urls: list[Optional[str]],
+    on_done: Callable[[], None],
+    extract_pool: Optional[ProcessPoolExecutor] = None
+) -> list[tuple[Optional[bytes], Optional[str]]]:
+    """Download all pages concurrently over one aiohttp connection pool.
+
+    With `extract_pool`, each page goes to a worker process as soon as it
+    arrives, so extraction overlaps the downloads still in flight.
+    """
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=DEFAULT_HEADERS) as session:
+        async def _one(url: Optional[str]) -> tuple[Optional[bytes], Optional[str]]:
+            if url is None:
+                on_done()
+                return None, None
+            try:
+                async with session.get(url) as resp:
+                    html = await resp.read() if resp.status == 200 else b""
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                console.print(f"[dim]Async fetch error: {e}[/dim]")
+                html = b""
+            finally:
+                on_done()
+            
+            if not html or extract_pool is None:
+                return html, None
+            try:
+                return html, await loop.run_in_executor(extract_pool, extract_main_text, html)
+            except (OSError, BrokenProcessPool) as e:
+                # Left as None: fetch_single_article extracts it in a thread instead
+                if isinstance(e, BrokenProcessPool):
+                    _discard_extract_pool(extract_pool)
+                console.print(f"[dim]Extract worker error: {e}[/dim]")
+                return html, None
+        
+        return await asyncio.gather(*(_one(url) for url in urls))
+
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_FAILED = False  # creation failed once (e.g. Termux); don't retry every batch
+_extract_pool_lock = threading.Lock()
+
+def _get_extract_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared extraction pool, starting it on first use (None if unavailable).
+
+    Workers come from forkserver/spawn rather than fork, so they never inherit
+    locks held by this process's threads, and live until interpreter exit so
+    repeated batches don't pay process start-up again. They do import this
+    module, which is why the cache DB, Groq client and save pool are all
+    created on first use rather than at import.
+    """
+    global _EXTRACT_POOL, _EXTRACT_POOL_FAILED
+    with _extract_pool_lock:
+        if _EXTRACT_POOL is None and not _EXTRACT_POOL_FAILED and EXTRACT_PROCESSES >= 2:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            try:
+                ctx = multiprocessing.get_context(method)
+                if method == 'forkserver':
+                    # Import this module once in the server; workers fork from it ready-made
+                    ctx.set_forkserver_preload(['__main__', __name__])
+                _EXTRACT_POOL = ProcessPoolExecutor(max_workers=EXTRACT_PROCESSES, mp_context=ctx)
+                atexit.register(_EXTRACT_POOL.shutdown)
+            except (OSError, ImportError, NotImplementedError, ValueError) as e:
+                # e.g. Termux/Android has no working sem_open for multiprocessing
+                _EXTRACT_POOL_FAILED = True
+                console.print(f"[dim]Process pool unavailable, extracting in threads: {e}[/dim]")
+        return _EXTRACT_POOL
+
+def _discard_extract_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next batch starts a fresh one."""
+    global _EXTRACT_POOL
+    with _extract_pool_lock:
+        if _EXTRACT_POOL is pool:
+            _EXTRACT_POOL = None
+    pool.shutdown(wait=False)
+
+def _extract_all(pages: list[Optional[bytes]]) -> list[Optional[str]]:
+    """Run the CPU-bound primary extraction across worker processes.
+
+    Entries left as None are extracted later by `fetch_single_article`
+    (nothing to extract, too little work for a pool, or no pool available).
+    """
+    texts: list[Optional[str]] = [None] * len(pages)
+    jobs = [i for i, html in enumerate(pages) if html]
+    pool = _get_extract_pool() if len(jobs) >= 2 else None
+    if pool is None:
+        return texts
+    
+    try:
+        for i, text in zip(jobs, pool.map(extract_main_text, [pages[i] for i in jobs])):
+            texts[i] = text
+    except (OSError, BrokenProcessPool) as e:
+        if isinstance(e, BrokenProcessPool):
+            _discard_extract_pool(pool)
+        console.print(f"[dim]Extract worker error, extracting in threads: {e}[/dim]")
+    return texts
+
+def _download_and_extract(
+    urls: list[Optional[str]],
+    on_done: Callable[[], None]
+) -> tuple[list[Optional[bytes]], list[Optional[str]]]:
+    """Download all pages (None entries are skipped) and run primary extraction.
+
+    With aiohttp the two stages are pipelined on a private event loop; otherwise
+    (or when called from inside a running loop, where asyncio.run can't nest)
+    pages are downloaded in threads and extracted once all of them are in.
+    """
+    if sum(1 for url in urls if url) <= 1:
+        # Nothing to overlap: skip the event loop, executors and process pool
+        pages = []
+        for url in urls:
+            pages.append(download_html(url) if url else None)
+            on_done()
+        return pages, [None] * len(urls)
+    
+    try:
+        asyncio.get_running_loop()
+        in_event_loop = True
+    except RuntimeError:
+        in_event_loop = False
+    
+    if not AIOHTTP_AVAILABLE or in_event_loop:
+        def _one(url: Optional[str]) -> Optional[bytes]:
+            try:
+                return download_html(url) if url else None
+            finally:
+                on_done()
+        
+        with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
+            pages = list(executor.map(_one, urls))
+        return pages, _extract_all(pages)
+    
+    results = asyncio.run(_download_all_async(urls, on_done, _get_extract_pool()))
+    return [html for html, _ in results], [text for _, text in results]
+
 def enrich_news_content(
     news_list: list[dict[str, Any]], 
     do_translate: bool = False, 
@@ -873,32 +1655,78 @@ def enrich_news_content(
         TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("Processing articles...", total=len(news_list))
+        download_task = progress.add_task("Downloading articles...", total=len(news_list))
+        process_task = progress.add_task("Extracting text...", total=len(news_list))
         
-        with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
-            future_to_news = {
-                executor.submit(fetch_single_article, item, do_translate, do_summarize, do_sentiment, topic): item 
-                for item in news_list
-            }
-            
-            for future in as_completed(future_to_news):
-                try:
-                    data = future.result()
-                    enriched_results.append(data)
-                except (OSError, RuntimeError) as e:
-                    console.print(f"[dim]Article fetch error: {e}[/dim]")
-                    item = future_to_news[future]
-                    item['full_text'] = ""
-                    enriched_results.append(item)
-                progress.update(task, advance=1)
+        # Phase 1: download (I/O, asyncio) feeding extract (CPU, processes) -> fallbacks/metadata/cache (threads).
+        # Translation, sentiment and AI run afterwards in bulk.
+        urls = [item['url'] if _needs_download(item) else None for item in news_list]
+        pages, texts = _download_and_extract(urls, lambda: progress.update(download_task, advance=1))
+        
+        def _finish(job: tuple[dict[str, Any], Optional[bytes], Optional[str]]) -> dict[str, Any]:
+            item, html, text = job
+            try:
+                return fetch_single_article(item, False, False, False, topic, html, text)
+            except (OSError, RuntimeError) as e:
+                console.print(f"[dim]Article fetch error: {e}[/dim]")
+                item['full_text'] = ""
+                return item
+            finally:
+                progress.update(process_task, advance=1)
+        
+        jobs = list(zip(news_list, pages, texts))
+        if len(jobs) == 1:
+            # Single article (direct URL): no pool to set up
+            enriched_results = [_finish(jobs[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_THREADS, len(jobs))) as executor:
+                enriched_results = list(executor.map(_finish, jobs))
+        
+        # Raw HTML is the bulk of the per-article memory; drop it before the slow AI/translate phases
+        del jobs, pages, texts
+    
+    # Phase 2: translate all titles + paragraphs in a few packed requests
+    if do_translate:
+        with console.status("[bold cyan]🌐 Translate:[/bold cyan] menerjemahkan artikel..."):
+            translate_articles(enriched_results, target='id')
+    
+    # Phase 3: sentiment on the final (possibly translated) text
+    if do_sentiment:
+        for item in enriched_results:
+            if item.get('full_text'):
+                item['sentiment'] = analyze_sentiment(item['full_text'])
+    
+    # AI Summarization + Tweet (batched: several articles per API call)
+    if do_summarize and ((AI_PROVIDER == "groq" and GROQ_API_KEY) or (AI_PROVIDER == "gemini" and GEMINI_API_KEY)):
+        with console.status(f"[bold cyan]🧠 AI {AI_PROVIDER.upper()}:[/bold cyan] membuat ringkasan & draft tweet..."):
+            ai_batch_process(enriched_results, topic)
     
     return enriched_results
 
 # --- Filtering ---
+@lru_cache(maxsize=4096)
+def _parse_pub_date(date_str: str) -> datetime:
+    # Memoized (watch mode re-parses the same dates every tick).
+    # Fast path: DDG dates are ISO-8601; dateutil only for anything else
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return parser.parse(date_str)
+
+# Full-title similarity a same-source/day/prefix signature match still needs: well below
+# TitleIndex's bar (re-edited headlines), above recurring formats like "Stock market today: ..."
+_SIGNATURE_MIN_RATIO = 0.8
+
 def filter_recent_news(news_list: list[dict[str, Any]], days: int = 2) -> list[dict[str, Any]]:
     recent_news: list[dict[str, Any]] = []
-    seen_titles: set[str] = set()
-    cutoff_date = datetime.now().astimezone() - timedelta(days=days)
+    seen_titles = TitleIndex()
+    # Second layer: same outlet, same day, same headline opening (re-edited headlines)
+    seen_signatures: dict[tuple[str, Any, str], list[str]] = {}
+    now_local = datetime.now().astimezone()
+    local_tz = now_local.tzinfo
+    cutoff_date = now_local - timedelta(days=days)
+    # Cheap string prefilter for ISO dates; one day of slack covers timezone offsets
+    cutoff_prefix = (cutoff_date - timedelta(days=1)).strftime('%Y-%m-%d')
     
     console.print("[dim]Menyaring berita terbaru & menghapus duplikat...[/dim]")
     
@@ -906,34 +1734,48 @@ def filter_recent_news(news_list: list[dict[str, Any]], days: int = 2) -> list[d
         date_str = item.get('date')
         if not date_str:
             continue
+        if isinstance(date_str, str) and date_str[4:5] == '-' and date_str[:10] < cutoff_prefix:
+            continue
         try:
-            pub_date = parser.parse(date_str)
+            pub_date = _parse_pub_date(date_str)
             if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                pub_date = pub_date.replace(tzinfo=local_tz)
             if pub_date >= cutoff_date:
-                if is_duplicate(item, seen_titles):
+                title = clean_title(item.get('title', ''))
+                signature = (item.get('source', ''), pub_date.date(), title[:40])
+                if is_duplicate(item, seen_titles) or any(
+                    title_ratio(title, earlier) >= _SIGNATURE_MIN_RATIO
+                    for earlier in seen_signatures.get(signature, ())
+                ):
                     continue
-                seen_titles.add(clean_title(item.get('title', '')))
+                seen_signatures.setdefault(signature, []).append(title)
+                seen_titles.add(title)
                 item['_raw_date'] = pub_date
-                item['formatted_date'] = pub_date.strftime('%Y-%m-%d %H:%M:%S')
+                item['formatted_date'] = pub_date.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
                 item['body'] = item.get('body', '')
                 recent_news.append(item)
         except (ValueError, TypeError):
             continue
     
-    recent_news.sort(key=lambda x: x.get('_raw_date', datetime.min), reverse=True)
+    recent_news.sort(key=lambda x: x['_raw_date'], reverse=True)
     return recent_news
 
 # --- Search ---
-def search_topic(topic: str, region: str = 'wt-wt', max_results: int = 50) -> list[dict[str, Any]]:
+def search_topic(
+    topic: str,
+    region: str = 'wt-wt',
+    max_results: int = 50,
+    max_age: Optional[float] = None
+) -> list[dict[str, Any]]:
     console.print(f"\n[bold green]🔍 Mencari:[/bold green] '{topic}'")
     
-    # Check cache
-    cache_key = f"search_{topic}_{region}_{max_results}"
-    cached = cache.get(cache_key)
+    # Check cache (case/spacing variants of a retyped query share one entry; DDG ignores both)
+    cache_key = f"search_{' '.join(topic.split()).casefold()}_{region}_{max_results}"
+    cached = cache.get(cache_key, max_age=max_age)
     if cached:
         console.print("[dim]📦 Menggunakan cache...[/dim]")
-        return cached
+        # Served from the in-memory LRU: hand out copies, callers mutate the items
+        return [dict(r) for r in cached]
     
     results: list[dict[str, Any]] = []
     attempt = 0
@@ -959,45 +1801,81 @@ def search_topic(topic: str, region: str = 'wt-wt', max_results: int = 50) -> li
                 time.sleep(wait_time)
     
     if results:
-        cache.set(cache_key, results)
+        cache.set(cache_key, [dict(r) for r in results])
     
     return results
 
 # --- Save Functions ---
+@lru_cache(maxsize=None)
+def _save_pool() -> ThreadPoolExecutor:
+    """Report writers are independent and I/O-bound, so they run side by side."""
+    pool = ThreadPoolExecutor(max_workers=3)
+    atexit.register(pool.shutdown)
+    return pool
+
+ReportPaths = namedtuple('ReportPaths', 'csv json md')
+
+def build_report_paths(safe_topic: str, ts: Optional[int] = None) -> ReportPaths:
+    """Report filenames for one run; `ts` suffixes them so repeated runs don't overwrite."""
+    suffix = f"_{ts}" if ts else ""
+    return ReportPaths(
+        f"news_{safe_topic}{suffix}.csv",
+        f"news_{safe_topic}{suffix}.json",
+        f"Laporan_{safe_topic}{suffix}.md"
+    )
+
+def save_reports(*jobs: Callable[[], None]) -> None:
+    """Run save_to_* jobs (built with functools.partial) concurrently and wait for all."""
+    if len(jobs) == 1:
+        jobs[0]()
+        return
+    list(_save_pool().map(lambda job: job(), jobs))
+
+_UNSAFE_PATH_CHARS = re.compile(r'[^\w\.-]')
+
 def get_dated_output_path(filename: str) -> str:
     """Generate path with date-based subdirectory structure and sanitized filename."""
     # Sanitize filename to prevent path traversal
-    filename = re.sub(r'[^\w\.-]', '_', os.path.basename(filename))
+    filename = _UNSAFE_PATH_CHARS.sub('_', os.path.basename(filename))
     
     today = datetime.now().strftime('%Y-%m-%d')
     target_dir = os.path.join(OUTPUT_DIR, today)
-    if not os.path.exists(target_dir):
-        os.makedirs(target_dir)
+    _ensure_dir(target_dir)
     return os.path.join(target_dir, filename)
 
-def save_to_csv(news_list: list[dict[str, Any]], filename: str) -> None:
+def _sentiment_cell(sentiment: dict[str, Any]) -> str:
+    return f"{sentiment.get('label', '')} ({sentiment.get('score', 0):.2f})"
+
+def _open_report(filepath: str, mode: str, compress: bool, **kwargs: Any):
+    """Open an export file for writing, gzip-compressed when requested."""
+    if compress:
+        # Level 6: nearly all of level 9's size reduction for much less CPU
+        return gzip.open(filepath, mode if 'b' in mode else mode + 't', compresslevel=6, **kwargs)
+    return open(filepath, mode, **kwargs)
+
+def save_to_csv(news_list: list[dict[str, Any]], filename: str, compress: bool = False) -> None:
     if not news_list:
         return
     ensure_output_dir()
-    filepath = get_dated_output_path(filename)
+    filepath = get_dated_output_path(filename) + ('.gz' if compress else '')
     keys = ['title', 'source', 'formatted_date', 'url', 'body', 'full_text', 'ai_summary', 'sentiment', 'is_translated']
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with _open_report(filepath, 'w', compress, newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=keys, extrasaction='ignore')
             writer.writeheader()
-            for item in news_list:
-                row = item.copy()
-                row['sentiment'] = f"{item.get('sentiment', {}).get('label', '')} ({item.get('sentiment', {}).get('score', 0):.2f})"
-                writer.writerow(row)
+            writer.writerows(
+                {**item, 'sentiment': _sentiment_cell(item.get('sentiment') or {})}
+                for item in news_list
+            )
         console.print(f"[green]✅ CSV tersimpan:[/green] {filepath}")
     except IOError as e:
         console.print(f"[red]❌ Gagal CSV: {e}[/red]")
 
-def save_to_json(news_list: list[dict[str, Any]], filename: str) -> None:
+def save_to_json(news_list: list[dict[str, Any]], filename: str, compress: bool = False) -> None:
     if not news_list:
         return
     ensure_output_dir()
-    filepath = get_dated_output_path(filename)
+    filepath = get_dated_output_path(filename) + ('.gz' if compress else '')
     
     # Clean data for JSON
     export_data = []
@@ -1015,65 +1893,75 @@ def save_to_json(news_list: list[dict[str, Any]], filename: str) -> None:
         export_data.append(clean_item)
     
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
-                'generated_at': datetime.now().isoformat(),
-                'total_articles': len(export_data),
-                'articles': export_data
-            }, f, ensure_ascii=False, indent=2)
+        payload = {
+            'generated_at': datetime.now().isoformat(),
+            'total_articles': len(export_data),
+            'articles': export_data
+        }
+        if ORJSON_AVAILABLE:
+            with _open_report(filepath, 'wb', compress) as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with _open_report(filepath, 'w', compress, encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
         console.print(f"[green]✅ JSON tersimpan:[/green] {filepath}")
     except IOError as e:
         console.print(f"[red]❌ Gagal JSON: {e}[/red]")
 
+# Topic keyword rules in priority order, each compiled into a single regex
+_TOPIC_EMOJI_RULES = [
+    (re.compile(pattern), icon) for pattern, icon in [
+        ('ai|tech|robot|data|cyber|app|soft|hard', "🤖"),
+        ('saham|uang|bisnis|ekonomi|market|stock|profit|crypto|bitcoin|btc|invest', "💰"),
+        ('sehat|dokter|virus|obat|medis', "🏥"),
+        ('game|play|esport', "🎮"),
+        ('politik|presiden|hukum|negara|dpr|mpr|partai', "⚖️"),
+    ]
+]
+
+_COUNTRY_FLAGS = {
+    'indonesia': '🇮🇩', 'jakarta': '🇮🇩', 'rupiah': '🇮🇩', 'jokowi': '🇮🇩', 'prabowo': '🇮🇩',
+    'amerika': '🇺🇸', 'usa': '🇺🇸', 'united states': '🇺🇸', 'biden': '🇺🇸', 'trump': '🇺🇸', 'dollar': '🇺🇸',
+    'china': '🇨🇳', 'tiongkok': '🇨🇳', 'beijing': '🇨🇳', 'xi jinping': '🇨🇳', 'yuan': '🇨🇳',
+    'jepang': '🇯🇵', 'japan': '🇯🇵', 'tokyo': '🇯🇵', 'yen': '🇯🇵',
+    'korea': '🇰🇷', 'seoul': '🇰🇷', 'k-pop': '🇰🇷',
+    'rusia': '🇷🇺', 'russia': '🇷🇺', 'moskow': '🇷🇺', 'putin': '🇷🇺',
+    'ukraina': '🇺🇦', 'ukraine': '🇺🇦', 'kiev': '🇺🇦', 'kyiv': '🇺🇦',
+    'inggris': '🇬🇧', 'uk': '🇬🇧', 'london': '🇬🇧',
+    'eropa': '🇪🇺', 'europe': '🇪🇺', 'eu': '🇪🇺',
+    'palestina': '🇵🇸', 'gaza': '🇵🇸', 'hamas': '🇵🇸',
+    'israel': '🇮🇱', 'tel aviv': '🇮🇱',
+    'arab': '🇸🇦', 'saudi': '🇸🇦', 'mekkah': '🇸🇦',
+    'malaysia': '🇲🇾', 'kuala lumpur': '🇲🇾',
+    'singapura': '🇸🇬', 'singapore': '🇸🇬',
+    'india': '🇮🇳', 'new delhi': '🇮🇳',
+    'jerman': '🇩🇪', 'germany': '🇩🇪',
+    'prancis': '🇫🇷', 'france': '🇫🇷'
+}
+# Longest keywords first so e.g. 'united states' wins over shorter overlaps. Matches
+# don't overlap, so a short key inside a longer one ('uk' in 'ukraina') no longer
+# adds its own flag the way the old per-keyword 'in' checks did.
+_COUNTRY_PATTERN = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_COUNTRY_FLAGS, key=len, reverse=True))
+)
+
 def get_relevant_emoji(text):
     """Select emoji based on topic and country keywords."""
     text = text.lower()
     emojis = []
 
-    # 1. Topic Emoji (Primary)
+    # Topic Emoji
     topic_icon = "📢"
-    if any(k in text for k in ['ai', 'tech', 'robot', 'data', 'cyber', 'app', 'soft', 'hard']):
-        topic_icon = "🤖"
-    elif any(k in text for k in ['saham', 'uang', 'bisnis', 'ekonomi', 'market', 'stock', 'profit', 'crypto', 'bitcoin', 'btc', 'invest']):
-        topic_icon = "💰"
-    elif any(k in text for k in ['sehat', 'dokter', 'virus', 'obat', 'medis']):
-        topic_icon = "🏥"
-    elif any(k in text for k in ['game', 'play', 'esport']):
-        topic_icon = "🎮"
-    elif any(k in text for k in ['politik', 'presiden', 'hukum', 'negara', 'dpr', 'mpr', 'partai']):
-        topic_icon = "⚖️"
-    
+    for pattern, icon in _TOPIC_EMOJI_RULES:
+        if pattern.search(text):
+            topic_icon = icon
+            break
     emojis.append(topic_icon)
 
-    # 2. Country Flags Detection
-    country_map = {
-        'indonesia': '🇮🇩', 'jakarta': '🇮🇩', 'rupiah': '🇮🇩', 'jokowi': '🇮🇩', 'prabowo': '🇮🇩',
-        'amerika': '🇺🇸', 'usa': '🇺🇸', 'united states': '🇺🇸', 'biden': '🇺🇸', 'trump': '🇺🇸', 'dollar': '🇺🇸',
-        'china': '🇨🇳', 'tiongkok': '🇨🇳', 'beijing': '🇨🇳', 'xi jinping': '🇨🇳', 'yuan': '🇨🇳',
-        'jepang': '🇯🇵', 'japan': '🇯🇵', 'tokyo': '🇯🇵', 'yen': '🇯🇵',
-        'korea': '🇰🇷', 'seoul': '🇰🇷', 'k-pop': '🇰🇷',
-        'rusia': '🇷🇺', 'russia': '🇷🇺', 'moskow': '🇷🇺', 'putin': '🇷🇺',
-        'ukraina': '🇺🇦', 'ukraine': '🇺🇦', 'kiev': '🇺🇦', 'kyiv': '🇺🇦',
-        'inggris': '🇬🇧', 'uk': '🇬🇧', 'london': '🇬🇧',
-        'eropa': '🇪🇺', 'europe': '🇪🇺', 'eu': '🇪🇺',
-        'palestina': '🇵🇸', 'gaza': '🇵🇸', 'hamas': '🇵🇸',
-        'israel': '🇮🇱', 'tel aviv': '🇮🇱',
-        'arab': '🇸🇦', 'saudi': '🇸🇦', 'mekkah': '🇸🇦',
-        'malaysia': '🇲🇾', 'kuala lumpur': '🇲🇾',
-        'singapura': '🇸🇬', 'singapore': '🇸🇬',
-        'india': '🇮🇳', 'new delhi': '🇮🇳',
-        'jerman': '🇩🇪', 'germany': '🇩🇪',
-        'prancis': '🇫🇷', 'france': '🇫🇷'
-    }
-
-    found_flags = set()
-    for keyword, flag in country_map.items():
-        if keyword in text:
-            found_flags.add(flag)
-    
+    # Country Flags (single pass over the text)
+    found_flags = {_COUNTRY_FLAGS[m.group(0)] for m in _COUNTRY_PATTERN.finditer(text)}
     if found_flags:
-        sorted_flags = sorted(list(found_flags))
-        emojis.extend(sorted_flags[:2]) # Max 2 flags
+        emojis.extend(sorted(found_flags)[:2]) # Max 2 flags
 
     return " ".join(emojis)
 
@@ -1091,9 +1979,10 @@ def generate_tweet(title, text, topic, ai_summary=""):
     
     # Use AI summary if available, otherwise use first sentence
     if ai_summary:
-        summary = ai_summary.split('.')[0].strip() + "."
+        summary = ai_summary.split('.', 1)[0].strip() + "."
     elif text:
-        summary = text.split('.')[0].strip() + "."
+        # Only the first sentence is needed; don't split the whole article
+        summary = text.split('.', 1)[0].strip() + "."
     else:
         summary = "Simak informasi selengkapnya."
     
@@ -1112,74 +2001,88 @@ def save_to_markdown(news_list, filename, topic):
     ensure_output_dir()
     filepath = get_dated_output_path(filename)
     
+    parts = []
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"# 📰 Laporan Lengkap: {topic}\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-            f.write(f"**Total Artikel:** {len(news_list)}\n\n")
+        parts.append(f"# 📰 Laporan Lengkap: {topic}\n\n")
+        parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+        parts.append(f"**Total Artikel:** {len(news_list)}\n\n")
+        
+        # Statistics
+        sentiments = [n.get('sentiment', {}).get('label', 'Unknown') for n in news_list]
+        pos_count = sentiments.count('Positif')
+        neg_count = sentiments.count('Negatif')
+        neu_count = sentiments.count('Netral')
+        
+        parts.append(f"**Sentiment Overview:** 😊 Positif: {pos_count} | 😟 Negatif: {neg_count} | 😐 Netral: {neu_count}\n\n")
+        parts.append("---\n\n")
+        
+        for i, news in enumerate(news_list, 1):
+            title = news.get('title', 'Tanpa Judul')
+            source = news.get('source', 'Unknown')
+            date = news.get('formatted_date', '-')
+            link = news.get('url', '#')
+            full_text = news.get('full_text', '')
+            ai_summary = news.get('ai_summary', '')
+            sentiment = news.get('sentiment', {})
+            is_trans = news.get('is_translated', False)
             
-            # Statistics
-            sentiments = [n.get('sentiment', {}).get('label', 'Unknown') for n in news_list]
-            pos_count = sentiments.count('Positif')
-            neg_count = sentiments.count('Negatif')
-            neu_count = sentiments.count('Netral')
+            trans_badge = " *(Diterjemahkan)*" if is_trans else ""
+            sentiment_badge = f" {sentiment.get('emoji', '')} {sentiment.get('label', '')}"
             
-            f.write(f"**Sentiment Overview:** 😊 Positif: {pos_count} | 😟 Negatif: {neg_count} | 😐 Netral: {neu_count}\n\n")
-            f.write("---\n\n")
+            parts.append(f"## {i}. {title}{trans_badge}\n")
+            parts.append(f"_{source} • {date}_ |{sentiment_badge}\n\n")
             
-            for i, news in enumerate(news_list, 1):
-                title = news.get('title', 'Tanpa Judul')
-                source = news.get('source', 'Unknown')
-                date = news.get('formatted_date', '-')
-                link = news.get('url', '#')
-                full_text = news.get('full_text', '')
-                ai_summary = news.get('ai_summary', '')
-                sentiment = news.get('sentiment', {})
-                is_trans = news.get('is_translated', False)
-                
-                trans_badge = " *(Diterjemahkan)*" if is_trans else ""
-                sentiment_badge = f" {sentiment.get('emoji', '')} {sentiment.get('label', '')}"
-                
-                f.write(f"## {i}. {title}{trans_badge}\n")
-                f.write(f"_{source} • {date}_ |{sentiment_badge}\n\n")
-                
-                # AI Summary Section
-                if ai_summary:
-                    f.write("### 🧠 AI Summary\n")
-                    f.write(f"> {ai_summary}\n\n")
-                
-                # Tweet Draft - Use AI tweet if available
-                ai_tweet = news.get('ai_tweet', '')
-                if ai_tweet:
-                    tweet_draft = ai_tweet
-                else:
-                    # Fallback to manual generation
-                    content_for_tweet = full_text if full_text else news.get('body', '')
-                    tweet_draft = generate_tweet(title, content_for_tweet, topic, ai_summary)
-                
-                f.write("### 🐦 Draft X/Twitter (Copy-Paste Ready)\n")
-                f.write(f"_{len(tweet_draft)} karakter_\n")
-                f.write("```text\n")
-                f.write(tweet_draft)
-                f.write("\n```\n\n")
-                
-                # Full Text
-                if full_text:
-                    clean_text = "\n\n".join([p.strip() for p in full_text.split('\n') if p.strip()])
-                    # Truncate for readability
-                    if len(clean_text) > 10000:
-                        clean_text = clean_text[:10000] + "\n\n_... (teks dipotong agar file tidak terlalu besar)_"
-                    f.write(f"{clean_text}\n\n")
-                else:
-                    f.write("_Tidak ada konten teks._\n\n")
-                
-                f.write(f"[🔗 Baca Sumber Asli]({link})\n\n")
-                f.write("---\n\n")
+            # AI Summary Section
+            if ai_summary:
+                parts.append("### 🧠 AI Summary\n")
+                parts.append(f"> {ai_summary}\n\n")
+            
+            # Tweet Draft - Use AI tweet if available
+            ai_tweet = news.get('ai_tweet', '')
+            if ai_tweet:
+                tweet_draft = ai_tweet
+            else:
+                # Fallback to manual generation
+                content_for_tweet = full_text if full_text else news.get('body', '')
+                tweet_draft = generate_tweet(title, content_for_tweet, topic, ai_summary)
+            
+            parts.append("### 🐦 Draft X/Twitter (Copy-Paste Ready)\n")
+            parts.append(f"_{len(tweet_draft)} karakter_\n")
+            parts.append("```text\n")
+            parts.append(tweet_draft)
+            parts.append("\n```\n\n")
+            
+            # Full Text
+            if full_text:
+                paragraphs = (p.strip() for p in full_text.split('\n'))
+                clean_text = "\n\n".join(p for p in paragraphs if p)
+                # Truncate for readability
+                if len(clean_text) > 10000:
+                    clean_text = clean_text[:10000] + "\n\n_... (teks dipotong agar file tidak terlalu besar)_"
+                parts.append(f"{clean_text}\n\n")
+            else:
+                parts.append("_Tidak ada konten teks._\n\n")
+            
+            parts.append(f"[🔗 Baca Sumber Asli]({link})\n\n")
+            parts.append("---\n\n")
+        
+        # Single write of the whole report instead of many small writes
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
         
         console.print(f"[green]✅ Laporan MD tersimpan:[/green] [bold]{filepath}[/bold]")
     except IOError as e:
         console.print(f"[red]❌ Gagal MD: {e}[/red]")
 
+@lru_cache(maxsize=2048)
+def _build_table_row(title, source, url, sent_str, tweet_text, title_width, source_width):
+    """Format the table cells of one article; memoized so redraws of unchanged articles are free."""
+    disp_title = title[:title_width - 3] + "..." if len(title) > title_width else title
+    # Clickable Source
+    source_link = f"[link={url}]{source[:source_width]}[/link]"
+    action_link = f"[link={generate_twitter_intent_url(tweet_text)}]🐦 Post[/link]"
+    return disp_title, source_link, sent_str, action_link
+
 def display_results_table(news_list, topic=""):
     """Display results in a rich table."""
     if not news_list:
@@ -1208,36 +2111,42 @@ def display_results_table(news_list, topic=""):
     
     for i, news in enumerate(news_list[:10], 1):  # Show max 10 in table
         title = news.get('title', 'N/A')
-        max_title_len = title_width - 3
-        disp_title = title[:max_title_len] + "..." if len(title) > title_width else title
-        source_name = news.get('source', 'N/A')[:source_width]
-        url = news.get('url', '#')
-        
         sentiment = news.get('sentiment', {})
-        sent_str = f"{sentiment.get('emoji', '')} {sentiment.get('label', 'N/A')}"
-        
-        # Clickable Source
-        source_link = f"[link={url}]{source_name}[/link]"
         
         # Prepare Tweet
-        ai_tweet = news.get('ai_tweet', '')
-        if ai_tweet:
-            tweet_text = ai_tweet
-        else:
-            tweet_text = generate_tweet(title, news.get('full_text', ''), topic, news.get('ai_summary', ''))
-            
-        tweet_url = generate_twitter_intent_url(tweet_text)
-        action_link = f"[link={tweet_url}]🐦 Post[/link]"
+        tweet_text = news.get('ai_tweet') or generate_tweet(title, news.get('full_text', ''), topic, news.get('ai_summary', ''))
         
-        if is_narrow:
-            table.add_row(str(i), disp_title, source_link, action_link)
-        else:
-            table.add_row(str(i), disp_title, source_link, sent_str, action_link)
-    
-    console.print(table)
+        disp_title, source_link, sent_str, action_link = _build_table_row(
+            title, news.get('source', 'N/A'), news.get('url', '#'),
+            f"{sentiment.get('emoji', '')} {sentiment.get('label', 'N/A')}",
+            tweet_text, title_width, source_width
+        )
+        
+        row = (str(i), disp_title, source_link, action_link) if is_narrow else (str(i), disp_title, source_link, sent_str, action_link)
+        table.add_row(*row)
     
+    # One print for table + footer: a single render pass and terminal write
     if len(news_list) > 10:
-        console.print(f"[dim]... dan {len(news_list) - 10} berita lainnya (lihat file output)[/dim]")
+        console.print(Group(table, f"[dim]... dan {len(news_list) - 10} berita lainnya (lihat file output)[/dim]"))
+    else:
+        console.print(table)
+
+def _set_choice_completion(options: Optional[list[str]]) -> None:
+    """Tab-complete menu choices where readline exists (not on Windows); None restores plain input."""
+    try:
+        import readline
+    except ImportError:
+        return
+    if options is None:
+        readline.set_completer(None)
+        return
+    
+    def complete(text: str, state: int) -> Optional[str]:
+        matches = [o for o in options if o.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    readline.set_completer(complete)
+    readline.parse_and_bind('tab: complete')
 
 def interactive_copy_selection(news_list, topic=""):
     """Interactive prompt to copy content to clipboard or regenerate AI content."""
@@ -1252,6 +2161,15 @@ def interactive_copy_selection(news_list, topic=""):
 """
     console.print(Panel(menu_text.strip(), title="📋 Apa yang mau dilakukan?", border_style="yellow"))
     
+    numbers = [str(i) for i in range(1, len(news_list) + 1)]
+    _set_choice_completion(numbers + ['r' + n for n in numbers])
+    try:
+        _copy_selection_loop(news_list, topic)
+    finally:
+        _set_choice_completion(None)
+
+def _copy_selection_loop(news_list, topic):
+    """Read copy/regenerate commands until the user presses Enter on an empty line."""
     while True:
         choice = console.input("\n[bold]Pilih > [/bold]").strip()
         
@@ -1343,21 +2261,47 @@ def interactive_copy_selection(news_list, topic=""):
 
 
 # --- Watch Mode ---
-def watch_mode(topic, region='wt-wt', interval_minutes=30, do_translate=False, do_summarize=False):
-    """Continuously monitor for new news."""
+def watch_mode(topic, region='wt-wt', interval_minutes=30, do_translate=False, do_summarize=False,
+               min_interval=None, max_interval=None):
+    """Continuously monitor for new news.
+    
+    The poll delay adapts (AIMD): halved after a tick with new articles, grown by one
+    base interval after a quiet tick, clamped to [min_interval, max_interval] minutes.
+    """
+    base_delay = interval_minutes * 60
+    min_delay = (min_interval if min_interval else max(1, interval_minutes // 4)) * 60
+    max_delay = (max_interval if max_interval else interval_minutes * 4) * 60
+    min_delay = min(min_delay, base_delay)
+    max_delay = max(max_delay, base_delay)
     console.print(f"\n[bold yellow]👁️ Watch Mode Aktif[/bold yellow]")
-    console.print(f"Topik: [cyan]{topic}[/cyan] | Interval: {interval_minutes} menit")
+    console.print(f"Topik: [cyan]{topic}[/cyan] | Interval: {interval_minutes} menit "
+                  f"(adaptif {min_delay // 60}-{max_delay // 60} menit)")
     console.print("[dim]Tekan Ctrl+C untuk berhenti[/dim]\n")
     
-    seen_urls = set()
+    # Persisted across runs: a restarted watch does not re-enrich (and re-bill AI for) old articles
+    seen_urls = SeenURLStore(Path(CACHE_DIR) / "watch_seen.db")
+    last_result_urls: frozenset = frozenset()
+    delay = base_delay
+    consecutive_misses = 0
     
     try:
+        next_tick = time.monotonic()
         while True:
-            raw = search_topic(topic, region=region, max_results=20)
-            filtered = filter_recent_news(raw, days=1)
+            # Fixed cadence: the interval counts from the start of each check, not its end
+            # (an overrunning check restarts the cadence instead of firing a burst of catch-ups)
+            tick_start = max(next_tick, time.monotonic())
+            # Bound search cache staleness by the poll delay (the 1h TTL would hide new articles)
+            raw = search_topic(topic, region=region, max_results=20, max_age=max(60, delay // 2))
             
-            # Find new articles
-            new_articles = [n for n in filtered if n.get('url') not in seen_urls]
+            # Same result set as last tick: filtering can only drop articles, so nothing new
+            result_urls = frozenset(r.get('url') for r in raw)
+            if result_urls == last_result_urls:
+                new_articles = []
+            else:
+                last_result_urls = result_urls
+                filtered = filter_recent_news(raw, days=1)
+                # Find new articles
+                new_articles = [n for n in filtered if n.get('url') not in seen_urls]
             
             if new_articles:
                 console.print(f"\n[bold green]🆕 {len(new_articles)} berita baru ditemukan![/bold green]")
@@ -1371,14 +2315,26 @@ def watch_mode(topic, region='wt-wt', interval_minutes=30, do_translate=False, d
                     console.print(f"  [dim]{article.get('source', '')} | {article.get('formatted_date', '')}[/dim]")
                     if article.get('ai_summary'):
                         console.print(f"  [green]→ {article.get('ai_summary')}[/green]")
+                seen_urls.flush()
+            
+            # Adaptive cadence: poll faster while news is breaking, back off while quiet
+            if new_articles:
+                consecutive_misses = 0
+                delay = max(min_delay, delay // 2)
             else:
-                console.print(f"[dim]⏳ {datetime.now().strftime('%H:%M:%S')} - Tidak ada berita baru[/dim]")
+                consecutive_misses += 1
+                delay = min(max_delay, delay + base_delay)
+            next_tick = tick_start + delay
             
-            # Wait for next check
-            time.sleep(interval_minutes * 60)
+            # Wait for next check; the idle status updates in place instead of stacking a line per tick
+            idle_note = "" if new_articles else f" - Tidak ada berita baru ({consecutive_misses}x)"
+            with console.status(f"[dim]⏳ {datetime.now().strftime('%H:%M:%S')}{idle_note} - cek lagi dalam {delay // 60} menit[/dim]"):
+                time.sleep(max(0.0, next_tick - time.monotonic()))
             
     except KeyboardInterrupt:
         console.print("\n[yellow]Watch mode dihentikan.[/yellow]")
+    finally:
+        seen_urls.close()
 
 # --- AI Settings Menu ---
 def ai_settings_menu():
@@ -1527,7 +2483,7 @@ def interactive_mode():
     current_model = GROQ_MODEL if AI_PROVIDER == "groq" else GEMINI_MODEL
     status_items.append(f"[bold yellow]Active: {current_ai}[/bold yellow] ({current_model})")
 
-    if TEXTBLOB_AVAILABLE:
+    if VADER_AVAILABLE or TEXTBLOB_AVAILABLE:
         status_items.append("[green]✓ Sentiment[/green]")
     if YAML_AVAILABLE:
         status_items.append("[green]✓ Custom Prompts[/green]")
@@ -1630,7 +2586,7 @@ def interactive_mode():
             continue
         
         # URL Check in Interactive Mode
-        is_url = topic.startswith(('http://', 'https://'))
+        is_url = is_direct_url(topic)
         
         # SMART DEFAULTS: No more questions - just process!
         region = 'wt-wt'  # Always global search
@@ -1640,13 +2596,7 @@ def interactive_mode():
         # Search or URL Processing
         if is_url:
             console.print(f"\n[dim]⚡ Mengekstrak konten dari URL...[/dim]")
-            filtered = [{
-                'url': topic,
-                'title': 'URL Processing...',
-                'source': 'Direct Link',
-                'formatted_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'body': ''
-            }]
+            filtered = [url_placeholder(topic)]
             actual_topic = "Direct Link"
         else:
             console.print(f"\n[dim]🔍 Mencari berita tentang '{topic}'...[/dim]")
@@ -1748,15 +2698,18 @@ def interactive_mode():
                 console.print("[dim]Perintah tidak dikenal. Ketik c/r/n atau Enter.[/dim]")
         
         # Save reports
-        ts = int(time.time())
-        if is_url and final_news[0].get('title') != 'URL Processing...':
-            safe_topic = "".join([c if c.isalnum() else "_" for c in final_news[0]['title'][:30]])
+        ts = time.time_ns() // 1_000_000_000
+        if is_url and final_news[0].get('title') != URL_PLACEHOLDER_TITLE:
+            safe_topic = safe_filename(final_news[0]['title'][:30])
         else:
-            safe_topic = "".join([c if c.isalnum() else "_" for c in topic[:30]])
+            safe_topic = safe_filename(topic[:30])
         
-        save_to_csv(final_news, f"news_{safe_topic}_{ts}.csv")
-        save_to_json(final_news, f"news_{safe_topic}_{ts}.json")
-        save_to_markdown(final_news, f"Laporan_{safe_topic}_{ts}.md", final_news[0].get('title', actual_topic))
+        paths = build_report_paths(safe_topic, ts)
+        save_reports(
+            partial(save_to_csv, final_news, paths.csv),
+            partial(save_to_json, final_news, paths.json),
+            partial(save_to_markdown, final_news, paths.md, final_news[0].get('title', actual_topic))
+        )
         
         console.print("\n" + "─" * 50 + "\n")
 
@@ -1782,8 +2735,11 @@ Contoh Penggunaan:
     parser_arg.add_argument("--sentiment", action="store_true", help="Aktifkan Sentiment Analysis")
     parser_arg.add_argument("--limit", type=int, default=50, help="Jumlah maksimal berita (default: 50)")
     parser_arg.add_argument("--json", action="store_true", help="Export ke format JSON")
+    parser_arg.add_argument("--compress", action="store_true", help="Kompres output CSV/JSON dengan gzip (.gz)")
     parser_arg.add_argument("--watch", action="store_true", help="Mode watch (monitoring berkelanjutan)")
     parser_arg.add_argument("--interval", type=int, default=30, help="Interval watch mode dalam menit (default: 30)")
+    parser_arg.add_argument("--min-interval", type=int, help="Interval minimum watch mode saat banyak berita baru (default: interval/4)")
+    parser_arg.add_argument("--max-interval", type=int, help="Interval maksimum watch mode saat sepi berita (default: interval*4)")
     parser_arg.add_argument("--clear-cache", action="store_true", help="Hapus cache")
     
     args = parser_arg.parse_args()
@@ -1810,17 +2766,11 @@ Contoh Penggunaan:
             console.print("\n[yellow]Bye![/yellow]")
     else:
         # Check if input is a URL
-        if args.topik.startswith(('http://', 'https://')):
+        if is_direct_url(args.topik):
             console.print(f"\n[bold green]🔗 Mendeteksi URL langsung:[/bold green] {args.topik}")
             
             # Create single item list
-            filtered = [{
-                'url': args.topik,
-                'title': 'URL Processing...', # Placeholder, will be updated in fetch_single_article
-                'source': 'Direct Link',
-                'formatted_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'body': ''
-            }]
+            filtered = [url_placeholder(args.topik)]
             
             # Force enable summary/sentiment for direct link if not specified (optional, but good UX)
             # But let's stick to flags to be consistent, or maybe enable them by default for single link?
@@ -1837,13 +2787,15 @@ Contoh Penggunaan:
             if final_news and final_news[0].get('full_text'):
                 # Update topic for filename based on extracted title
                 safe_topic = "Direct_Link"
-                if final_news[0].get('title') != 'URL Processing...':
-                     safe_topic = "".join([c if c.isalnum() else "_" for c in final_news[0]['title'][:30]])
+                if final_news[0].get('title') != URL_PLACEHOLDER_TITLE:
+                     safe_topic = safe_filename(final_news[0]['title'][:30])
                 
                 display_results_table(final_news, "Direct Link")
-                save_to_markdown(final_news, f"Laporan_{safe_topic}.md", final_news[0].get('title', 'Direct Link'))
+                paths = build_report_paths(safe_topic)
+                jobs = [partial(save_to_markdown, final_news, paths.md, final_news[0].get('title', 'Direct Link'))]
                 if args.json:
-                    save_to_json(final_news, f"news_{safe_topic}.json")
+                    jobs.append(partial(save_to_json, final_news, paths.json, args.compress))
+                save_reports(*jobs)
             else:
                  console.print("[red]❌ Gagal mengekstrak konten dari URL tersebut.[/red]")
             
@@ -1852,7 +2804,8 @@ Contoh Penggunaan:
         # Watch mode
         if args.watch:
             region = 'id-id' if args.indo else 'wt-wt'
-            watch_mode(args.topik, region, args.interval, args.translate, args.summary)
+            watch_mode(args.topik, region, args.interval, args.translate, args.summary,
+                       min_interval=args.min_interval, max_interval=args.max_interval)
             return
         
         # Normal mode
@@ -1879,12 +2832,14 @@ Contoh Penggunaan:
                 except KeyboardInterrupt:
                     pass
 
-            safe_topic = "".join([c if c.isalnum() else "_" for c in args.topik])
-            save_to_csv(final_news, f"news_{safe_topic}.csv")
-            save_to_markdown(final_news, f"Laporan_{safe_topic}.md", args.topik)
-            
+            paths = build_report_paths(safe_filename(args.topik))
+            jobs = [
+                partial(save_to_csv, final_news, paths.csv, args.compress),
+                partial(save_to_markdown, final_news, paths.md, args.topik)
+            ]
             if args.json:
-                save_to_json(final_news, f"news_{safe_topic}.json")
+                jobs.append(partial(save_to_json, final_news, paths.json, args.compress))
+            save_reports(*jobs)
         else:
             console.print("[yellow]Tidak ada berita valid.[/yellow]")
 
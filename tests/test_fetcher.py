@@ -0,0 +1,33 @@
+"""Tests for xnews.core.fetcher."""
+
+from datetime import datetime
+
+from xnews.core.fetcher import filter_recent_news
+
+
+def _item(title, source="Reuters"):
+    return {"title": title, "source": source, "date": datetime.now().astimezone().isoformat()}
+
+
+def test_same_prefix_different_stories_are_kept():
+    news = [
+        _item("Stock market today: Dow futures little changed as traders await jobs report"),
+        _item("Stock market today: Dow futures little changed; Tesla slides 8% on weak China sales"),
+    ]
+    assert len(filter_recent_news(news)) == 2
+
+
+def test_re_edited_headline_is_dropped():
+    news = [
+        _item("Live updates: Israel strikes Gaza as ceasefire talks stall"),
+        _item("Live updates: Israel strikes Gaza as ceasefire talks stall, dozens killed in Rafah"),
+    ]
+    assert len(filter_recent_news(news)) == 1
+
+
+def test_re_edited_headline_from_another_source_is_kept():
+    news = [
+        _item("Live updates: Israel strikes Gaza as ceasefire talks stall"),
+        _item("Live updates: Israel strikes Gaza as ceasefire talks stall, dozens killed in Rafah", source="AP"),
+    ]
+    assert len(filter_recent_news(news)) == 2
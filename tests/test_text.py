@@ -0,0 +1,34 @@
+"""Tests for xnews.utils.text."""
+
+import pytest
+
+from xnews.utils.text import TitleIndex, clean_title, get_relevant_emoji
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Harga Bitcoin naik tajam hari ini", "Harga Bitcoin naik tajam pada hari ini"),
+    ("SpaceX launches Starship on fifth test flight", "SpaceX launches Starship on its fifth test flight"),
+    ("Bitcoin tembus 70000 dolar AS hari ini", "Bitcoin tembus 70 000 dolar AS hari ini"),
+])
+def test_retyped_headlines_are_duplicates(first, second):
+    index = TitleIndex()
+    index.add(clean_title(first))
+    assert index.is_duplicate(clean_title(second))
+
+
+def test_different_headlines_are_kept():
+    index = TitleIndex()
+    index.add(clean_title("Harga Bitcoin naik tajam hari ini"))
+    assert not index.is_duplicate(clean_title("Harga emas turun tajam minggu ini"))
+
+
+def test_country_flags_prefer_longest_keyword():
+    emoji = get_relevant_emoji("Perang Rusia Ukraina memanas")
+    assert "🇷🇺" in emoji and "🇺🇦" in emoji
+    # 'uk' is only part of 'ukraina' here, not a separate mention
+    assert "🇬🇧" not in emoji
+
+
+def test_country_flags_keep_substring_matches():
+    assert "🇮🇩" in get_relevant_emoji("Indonesian markets rally")
+    assert "🇬🇧" in get_relevant_emoji("UK inflation eases")
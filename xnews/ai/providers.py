@@ -3,16 +3,27 @@ xnews - AI Providers Module
 Groq and Gemini AI integration for summarization and tweet generation.
 """
 
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Optional
 import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from rich.console import Console
 
 from xnews.config import (
     GROQ_API_KEY, GROQ_MODEL, 
     GEMINI_API_KEY, GEMINI_MODEL,
-    AI_PROVIDER, TextLimits
+    AI_PROVIDER, AI_BATCH_SIZE, AI_BATCH_WORKERS, TextLimits
 )
+from xnews.core.cache import cache
 from xnews.core.prompts import prompt_loader
 
 console = Console()
@@ -24,26 +35,72 @@ try:
 except ImportError:
     GROQ_AVAILABLE = False
 
+
+@lru_cache(maxsize=None)
+def _groq_client() -> Optional[Any]:
+    """Shared Groq client, built on first use (thread-safe, reuses its HTTP connection pool)."""
+    return Groq(api_key=GROQ_API_KEY) if GROQ_AVAILABLE and GROQ_API_KEY else None
+
+
+# The Gemini SDK is heavy; only probe for it here and import it on first use
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.generativeai") is not None
 except ImportError:
     GEMINI_AVAILABLE = False
+genai = None
+
+
+@lru_cache(maxsize=None)
+def _gemini_model(model_name: str) -> Any:
+    """Shared Gemini model per name (configured once, reused across calls and threads)."""
+    global genai
+    if genai is None:
+        import google.generativeai as genai
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(model_name)
 
 
 # --- Groq Functions ---
 
+def _groq_stream_text(messages: list[dict[str, str]], temperature: float, max_tokens: int, max_chars: Optional[int] = None) -> str:
+    """Run a streaming Groq chat completion and return the collected text.
+
+    When `max_chars` is set, the stream is closed as soon as the output grows
+    past it (the caller truncates there anyway), so no further tokens are decoded.
+    """
+    stream = _groq_client().chat.completions.create(
+        model=GROQ_MODEL,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    parts: list[str] = []
+    total = 0
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content or ""
+            parts.append(piece)
+            total += len(piece)
+            if max_chars is not None and total > max_chars:
+                break
+    finally:
+        stream.close()
+    return "".join(parts)
+
+
 def _groq_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False) -> str:
     """Summarize text using Groq LLM."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return ""
     
     if not text or len(text) < 100:
         return ""
     
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        truncated = text[:TextLimits.GROQ_MAX_INPUT] if len(text) > TextLimits.GROQ_MAX_INPUT else text
+        truncated = text[:TextLimits.GROQ_MAX_INPUT]
         
         if for_twitter:
             system_prompt = prompt_loader.get('summary', 'twitter', 'system', default="You are a social media expert.")
@@ -59,17 +116,15 @@ def _groq_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False
             user_prompt_tpl = prompt_loader.get('summary', 'standard', 'user', default="Summarize:\n\n{text}")
             user_prompt = user_prompt_tpl.format(text=truncated)
         
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[
+        result = _groq_stream_text(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.5,
-            max_tokens=1024
-        )
-        
-        result = response.choices[0].message.content.strip()
+            max_tokens=1024,
+            max_chars=TextLimits.TWEET_MAX_LENGTH if for_twitter else None
+        ).strip()
         if for_twitter and len(result) > TextLimits.TWEET_MAX_LENGTH:
             result = result[:TextLimits.TWEET_MAX_LENGTH - 3] + "..."
         return result
@@ -80,26 +135,23 @@ def _groq_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False
 
 def _groq_generate_tweet(title: str, text: str, topic: str) -> str:
     """Generate tweet using Groq."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return ""
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        truncated = text[:TextLimits.COMBINED_MAX_INPUT] if len(text) > TextLimits.COMBINED_MAX_INPUT else text
+        truncated = text[:TextLimits.COMBINED_MAX_INPUT]
         system_prompt = prompt_loader.get('tweet_generation', 'system', default="You are a twitter expert.")
         user_prompt_tpl = prompt_loader.get('tweet_generation', 'user', default="Title: {title}\nText: {text}")
         user_prompt = user_prompt_tpl.format(title=title, text=truncated)
 
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[
+        tweet_text = _groq_stream_text(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.6,
-            max_tokens=300
-        )
-        
-        tweet_text = response.choices[0].message.content.strip()
+            max_tokens=300,
+            max_chars=TextLimits.TWEET_MAX_LENGTH
+        ).strip()
         tweet_text = tweet_text.strip('"\'').replace('**', '').replace('__', '')
         if len(tweet_text) > TextLimits.TWEET_MAX_LENGTH:
             tweet_text = tweet_text[:TextLimits.TWEET_MAX_LENGTH - 3] + "..."
@@ -111,12 +163,12 @@ def _groq_generate_tweet(title: str, text: str, topic: str) -> str:
 
 def _groq_generate_combined(title: str, text: str, topic: str) -> dict[str, str]:
     """Generate both summary and tweet in single Groq API call."""
-    if not GROQ_AVAILABLE or not GROQ_API_KEY:
+    if _groq_client() is None:
         return {"tweet": "", "summary": ""}
     
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        truncated = text[:TextLimits.COMBINED_MAX_INPUT] if len(text) > TextLimits.COMBINED_MAX_INPUT else text
+        client = _groq_client()
+        truncated = text[:TextLimits.COMBINED_MAX_INPUT]
         
         system_prompt = prompt_loader.get('combined_generation', 'system', 
             default="Output JSON with 'tweet' and 'summary' keys.")
@@ -153,10 +205,9 @@ def _gemini_summarize(text: str, max_sentences: int = 3, for_twitter: bool = Fal
         return ""
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
-        truncated = text[:TextLimits.GEMINI_MAX_INPUT] if len(text) > TextLimits.GEMINI_MAX_INPUT else text
+        truncated = text[:TextLimits.GEMINI_MAX_INPUT]
         
         if for_twitter:
             system_prompt = prompt_loader.get('summary', 'twitter', 'system', default="You are a social media expert.")
@@ -199,10 +250,9 @@ def _gemini_generate_tweet(title: str, text: str, topic: str) -> str:
         return ""
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
-        truncated = text[:30000] if len(text) > 30000 else text
+        truncated = text[:TextLimits.GEMINI_TWEET_MAX_INPUT]
         
         system_prompt = prompt_loader.get('tweet_generation', 'system')
         user_prompt_tpl = prompt_loader.get('tweet_generation', 'user')
@@ -249,10 +299,9 @@ def _gemini_generate_combined(title: str, text: str, topic: str) -> dict[str, st
         return {"tweet": "", "summary": ""}
     
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = _gemini_model(GEMINI_MODEL)
         
-        truncated = text[:TextLimits.COMBINED_MAX_INPUT] if len(text) > TextLimits.COMBINED_MAX_INPUT else text
+        truncated = text[:TextLimits.COMBINED_MAX_INPUT]
         
         system_prompt = prompt_loader.get('combined_generation', 'system', 
             default="Output JSON with 'tweet' and 'summary' keys.")
@@ -287,21 +336,87 @@ def _gemini_generate_combined(title: str, text: str, topic: str) -> dict[str, st
         return {"tweet": "", "summary": ""}
 
 
+# --- Batch Functions ---
+
+def _build_batch_prompts(items: list[dict[str, Any]]) -> tuple[str, str]:
+    """Build system/user prompts for a numbered batch of articles."""
+    system_prompt = prompt_loader.get('batch_generation', 'system',
+        default="For each [ID n] article, output JSON {\"articles\": [{\"id\": n, \"tweet\": ..., \"summary\": ...}]}.")
+    user_prompt_tpl = prompt_loader.get('batch_generation', 'user', default="{articles}")
+
+    blocks: list[str] = []
+    for item in items:
+        truncated = item['text'][:TextLimits.COMBINED_MAX_INPUT]
+        blocks.append(f"[ID {item['id']}]\nJudul: {item['title']}\n\nIsi berita:\n{truncated}")
+
+    user_prompt = user_prompt_tpl.format(articles="\n\n---\n\n".join(blocks))
+    return system_prompt, user_prompt
+
+
+def _groq_generate_batch(items: list[dict[str, Any]]) -> dict[int, dict[str, str]]:
+    """Generate summary + tweet for several articles in a single Groq API call."""
+    if _groq_client() is None:
+        return {}
+
+    client = _groq_client()
+    system_prompt, user_prompt = _build_batch_prompts(items)
+
+    response = client.chat.completions.create(
+        model=GROQ_MODEL,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.6,
+        max_tokens=800 * len(items),
+        response_format={"type": "json_object"}
+    )
+
+    return _parse_batch_json(response.choices[0].message.content.strip())
+
+
+def _gemini_generate_batch(items: list[dict[str, Any]]) -> dict[int, dict[str, str]]:
+    """Generate summary + tweet for several articles in a single Gemini API call."""
+    if not GEMINI_AVAILABLE or not GEMINI_API_KEY:
+        return {}
+
+    model = _gemini_model(GEMINI_MODEL)
+    system_prompt, user_prompt = _build_batch_prompts(items)
+
+    response = model.generate_content(
+        f"{system_prompt}\n\n{user_prompt}",
+        generation_config=genai.types.GenerationConfig(
+            temperature=0.6,
+            max_output_tokens=1024 * len(items),
+            response_mime_type="application/json"
+        )
+    )
+
+    if not response.text:
+        return {}
+    return _parse_batch_json(response.text.strip())
+
+
 # --- Helper Functions ---
 
+# Markdown code fence around model JSON (closing fence optional: output may be cut off)
+_JSON_FENCE = re.compile(r"```(?:json)?(.*?)(?:```|$)", re.DOTALL)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _strip_json_fence(raw_output: str) -> str:
+    """Return the JSON inside a markdown code fence, or the whole output if unfenced."""
+    match = _JSON_FENCE.search(raw_output)
+    return (match.group(1) if match else raw_output).strip()
+
+
 def _parse_combined_json(raw_output: str) -> dict[str, str]:
     """Parse JSON from AI response with fallback handling."""
-    # Clean markdown code blocks if present
-    cleaned = raw_output
-    if "```json" in cleaned:
-        cleaned = cleaned.split("```json")[1].split("```")[0]
-    elif "```" in cleaned:
-        cleaned = cleaned.split("```")[1].split("```")[0]
-    
-    cleaned = cleaned.strip()
+    cleaned = _strip_json_fence(raw_output)
     
     try:
-        data = json.loads(cleaned)
+        data = _json_loads(cleaned)
         tweet = data.get("tweet", "").strip().replace('**', '').replace('__', '')
         summary = data.get("summary", "").strip()
         
@@ -314,6 +429,25 @@ def _parse_combined_json(raw_output: str) -> dict[str, str]:
         return {"tweet": raw_output[:750] if raw_output else "", "summary": ""}
 
 
+def _parse_batch_json(raw_output: str) -> dict[int, dict[str, str]]:
+    """Parse batch JSON response into {id: {"tweet", "summary"}}. Raises ValueError on bad JSON."""
+    data = _json_loads(_strip_json_fence(raw_output))
+    entries = data.get("articles", []) if isinstance(data, dict) else data
+
+    results: dict[int, dict[str, str]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or "id" not in entry:
+            continue
+        tweet = str(entry.get("tweet", "")).strip().replace('**', '').replace('__', '')
+        if len(tweet) > TextLimits.TWEET_MAX_LENGTH:
+            tweet = tweet[:TextLimits.TWEET_MAX_LENGTH - 3] + "..."
+        try:
+            results[int(entry["id"])] = {"tweet": tweet, "summary": str(entry.get("summary", "")).strip()}
+        except (TypeError, ValueError):
+            continue
+    return results
+
+
 # --- Public API Functions ---
 
 def ai_summarize(text: str, max_sentences: int = 3, for_twitter: bool = False, provider: Optional[str] = None) -> str:
@@ -344,3 +478,63 @@ def ai_generate_combined(title: str, text: str, topic: str, provider: Optional[s
         return _gemini_generate_combined(title, text, topic)
     else:
         return _groq_generate_combined(title, text, topic)
+
+
+def _ai_cache_key(model: str, topic: str, title: str, text: str) -> str:
+    """Cache key for a summary/tweet pair; CacheManager hashes it down to a fixed-size digest."""
+    return "\x00".join(("ai", model, topic, title, text))
+
+
+def ai_batch_process(
+    news_list: list[dict[str, Any]], 
+    topic: str, 
+    batch_size: int = AI_BATCH_SIZE, 
+    provider: Optional[str] = None
+) -> None:
+    """Fill ai_summary/ai_tweet for all articles using batched AI calls.
+
+    Articles are chunked into groups of `batch_size`, each group costs one API
+    call, and groups run in parallel (bounded by AI_BATCH_WORKERS). Articles a
+    batch fails to cover fall back to the per-article combined call.
+    """
+    target_provider = provider or AI_PROVIDER
+    batch_fn = _gemini_generate_batch if target_provider == "gemini" else _groq_generate_batch
+
+    model = GEMINI_MODEL if target_provider == "gemini" else GROQ_MODEL
+
+    # Articles already summarized (same model, topic and text) in this or an earlier run cost no call
+    pending = []
+    for i, item in enumerate(news_list, 1):
+        if len(item.get('full_text', '')) <= 100:
+            continue
+        key = _ai_cache_key(model, topic, item.get('title', ''), item['full_text'])
+        cached = cache.get(key)
+        if cached:
+            item['ai_summary'] = cached.get('summary', '')
+            item['ai_tweet'] = cached.get('tweet', '')
+        else:
+            pending.append({'id': i, 'title': item.get('title', ''), 'text': item['full_text'], 'key': key})
+    if not pending:
+        return
+
+    chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    def _run_chunk(chunk: list[dict[str, Any]]) -> None:
+        try:
+            results = batch_fn(chunk)
+        except Exception as e:
+            console.print(f"[dim]Batch AI error, falling back per article: {e}[/dim]")
+            results = {}
+
+        for entry in chunk:
+            item = news_list[entry['id'] - 1]
+            result = results.get(entry['id'])
+            if not result or not (result['tweet'] or result['summary']):
+                result = ai_generate_combined(entry['title'], entry['text'], topic, provider=target_provider)
+            item['ai_summary'] = result.get('summary', '')
+            item['ai_tweet'] = result.get('tweet', '')
+            if item['ai_summary'] or item['ai_tweet']:
+                cache.set(entry['key'], {'summary': item['ai_summary'], 'tweet': item['ai_tweet']})
+
+    with ThreadPoolExecutor(max_workers=AI_BATCH_WORKERS) as executor:
+        list(executor.map(_run_chunk, chunks))
@@ -26,10 +26,21 @@ MAX_THREADS = 10
 TIMEOUT_SECONDS = 15
 CACHE_TTL_HOURS = 1
 
+# --- AI Batching ---
+AI_BATCH_SIZE = 5      # Articles per batched AI request
+AI_BATCH_WORKERS = 3   # Parallel batch requests (keep under provider RPM limit)
+
+# --- Translation ---
+TRANSLATE_WORKERS = 4  # Parallel translation requests (Google throttles bursts)
+
+# --- Extraction ---
+EXTRACT_PROCESSES = os.cpu_count() or 1  # Worker processes for trafilatura.extract
+
 # --- Text Limits ---
 class TextLimits:
     GROQ_MAX_INPUT = 15000
     GEMINI_MAX_INPUT = 100000
+    GEMINI_TWEET_MAX_INPUT = 30000
     COMBINED_MAX_INPUT = 5000
     SENTIMENT_SAMPLE = 1000
     TRANSLATION_CHUNK = 4500
@@ -1,58 +1,212 @@
 """
 xnews - Cache Manager Module
-File-based caching with TTL support.
+SQLite-backed cache with TTL support and an in-memory LRU front.
 """
 
 import json
+import time
+import atexit
+import sqlite3
+import zlib
 import hashlib
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from xnews.config import CACHE_DIR, CACHE_TTL_HOURS
 
+# Cache key hashing: no cryptographic property needed, so prefer the fastest available
+try:
+    from blake3 import blake3 as _blake3
+    def _hash_key(key: str) -> str:
+        return _blake3(key.encode()).hexdigest()[:32]
+except ImportError:
+    try:
+        import xxhash
+        def _hash_key(key: str) -> str:
+            return xxhash.xxh3_128(key.encode()).hexdigest()
+    except ImportError:
+        def _hash_key(key: str) -> str:
+            return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+# Entries kept in memory to skip SQLite entirely on hot hits
+MEMORY_CACHE_SIZE = 256
+# Buffered writes are committed in batches of this size
+WRITE_BATCH_SIZE = 8
+# Payloads at least this large are zlib-compressed on disk (article texts)
+COMPRESS_MIN_BYTES = 1024
+
+# Bit flags in the `is_json` column (older rows only ever hold 0 or 1)
+_FLAG_JSON = 1
+_FLAG_ZLIB = 2
+
 
 class CacheManager:
-    """Simple file-based cache system with TTL."""
-    
+    """Cache system with TTL: in-memory LRU in front of a single SQLite file (WAL mode).
+
+    Strings are stored as raw UTF-8 text, everything else as JSON; large
+    payloads are zlib-compressed. Expired rows are pruned when the DB is first opened.
+    """
+
     def __init__(self) -> None:
         self.cache_dir: Path = Path(CACHE_DIR)
-        self.cache_dir.mkdir(exist_ok=True)
-    
+        self.ttl_seconds: float = CACHE_TTL_HOURS * 3600
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._pending: list[tuple[str, float, bytes, int]] = []
+
+        self._conn: Optional[sqlite3.Connection] = None
+        atexit.register(self.flush)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock).
+
+        Deferred so that merely importing the module, as spawned extract
+        workers do, never touches the cache file.
+        """
+        if self._conn is None:
+            self.cache_dir.mkdir(exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_dir / "cache.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, cached_at REAL, content BLOB, is_json INTEGER)"
+            )
+            try:
+                with conn:
+                    conn.execute("DELETE FROM cache WHERE cached_at < ?", (time.time() - self.ttl_seconds,))
+            except sqlite3.Error:
+                pass  # pruning is housekeeping; a busy DB must not keep the cache closed
+            self._conn = conn
+        return self._conn
+
     def _get_hash(self, key: str) -> str:
-        return hashlib.sha256(key.encode()).hexdigest()
-    
-    def get(self, key: str) -> Optional[Any]:
-        """Get cached value if exists and not expired."""
-        cache_file = self.cache_dir / f"{self._get_hash(key)}.json"
-        if not cache_file.exists():
-            return None
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            # Check TTL
-            cached_time = datetime.fromisoformat(data['cached_at'])
-            if datetime.now() - cached_time > timedelta(hours=CACHE_TTL_HOURS):
-                cache_file.unlink()
+        return _hash_key(key)
+
+    def _remember(self, hashed: str, cached_at: float, content: Any) -> None:
+        """Store in the in-memory LRU (caller holds the lock)."""
+        self._memory[hashed] = (cached_at, content)
+        self._memory.move_to_end(hashed)
+        if len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Get cached value if exists and not expired.
+
+        `max_age` (seconds) tightens the TTL for callers that need fresher data.
+        """
+        hashed = self._get_hash(key)
+        now = time.time()
+        limit = self.ttl_seconds if max_age is None else min(max_age, self.ttl_seconds)
+
+        with self._lock:
+            hit = self._memory.get(hashed)
+            if hit is not None:
+                if now - hit[0] < limit:
+                    self._memory.move_to_end(hashed)
+                    return hit[1]
+                if now - hit[0] < self.ttl_seconds:
+                    return None
+                del self._memory[hashed]
+
+            try:
+                row = self._db.execute(
+                    "SELECT cached_at, content, is_json FROM cache WHERE key = ?", (hashed,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+
+            cached_at, raw, flags = row
+            if now - cached_at >= self.ttl_seconds:
+                try:
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (hashed,))
+                    self._db.commit()
+                except sqlite3.Error:
+                    pass
                 return None
-            return data['content']
-        except (json.JSONDecodeError, KeyError, OSError):
-            return None
-    
+            if now - cached_at >= limit:
+                return None
+
+            try:
+                if flags & _FLAG_ZLIB:
+                    raw = zlib.decompress(raw)
+                if flags & _FLAG_JSON:
+                    content = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                else:
+                    content = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+            except (json.JSONDecodeError, UnicodeDecodeError, zlib.error):
+                return None
+
+            self._remember(hashed, cached_at, content)
+            return content
+
     def set(self, key: str, content: Any) -> None:
         """Cache a value with current timestamp."""
-        cache_file = self.cache_dir / f"{self._get_hash(key)}.json"
+        hashed = self._get_hash(key)
+        cached_at = time.time()
+        is_json = not isinstance(content, str)
+
         try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'cached_at': datetime.now().isoformat(),
-                    'content': content
-                }, f)
-        except OSError:
+            if not is_json:
+                raw = content.encode('utf-8')
+            elif ORJSON_AVAILABLE:
+                raw = orjson.dumps(content)
+            else:
+                raw = json.dumps(content).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+        flags = _FLAG_JSON if is_json else 0
+        if len(raw) >= COMPRESS_MIN_BYTES:
+            raw = zlib.compress(raw)
+            flags |= _FLAG_ZLIB
+
+        with self._lock:
+            self._remember(hashed, cached_at, content)
+            self._pending.append((hashed, cached_at, raw, flags))
+            if len(self._pending) >= WRITE_BATCH_SIZE:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO cache (key, cached_at, content, is_json) VALUES (?, ?, ?, ?)",
+                    self._pending
+                )
+        except sqlite3.Error:
             pass
-    
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Write any buffered entries to disk."""
+        with self._lock:
+            self._flush_locked()
+
     def clear(self) -> None:
-        """Clear all cached files."""
+        """Clear all cached entries."""
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM cache")
+            except sqlite3.Error:
+                pass
+        # Remove leftovers from the old one-file-per-entry cache
         for f in self.cache_dir.glob("*.json"):
             f.unlink()
 
@@ -7,37 +7,117 @@ import os
 import re
 import time
 import shutil
+import atexit
+import asyncio
+import threading
+import multiprocessing
 import subprocess
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Union
 
 import trafilatura
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dateutil import parser
 from ddgs import DDGS
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from xnews.config import (
     MAX_RETRIES, RETRY_DELAY, MAX_THREADS, TIMEOUT_SECONDS,
-    GROQ_API_KEY, GROQ_MODEL, AI_PROVIDER
+    EXTRACT_PROCESSES, GROQ_MODEL, AI_PROVIDER
 )
 from xnews.core.cache import cache
-from xnews.ai.providers import ai_generate_combined, ai_summarize, GROQ_AVAILABLE
+from xnews.ai.providers import ai_batch_process, ai_generate_combined, ai_summarize, _groq_client
 from xnews.utils.text import (
     analyze_sentiment, apply_translation, clean_title, 
-    is_duplicate, validate_url
+    is_duplicate, title_ratio, translate_articles, validate_url, TitleIndex
 )
 
 console = Console()
 
-# Lazy import for Groq (title generation fallback)
-try:
-    from groq import Groq
-except ImportError:
-    Groq = None
+# Modern User-Agent headers
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
+    "Referer": "https://www.google.com/",
+}
+
+# Shared pooled session (keep-alive reuse across worker threads)
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_THREADS,
+    pool_maxsize=MAX_THREADS * 2,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def download_html(url: str) -> bytes:
+    """Download raw HTML through the pooled session (b"" on failure)."""
+    try:
+        resp = SESSION.get(url, headers=DEFAULT_HEADERS, timeout=TIMEOUT_SECONDS)
+        return resp.content if resp.ok else b""
+    except requests.exceptions.SSLError:
+        console.print(f"[dim]SSL Verify error for {url}. Switching to cURL fallback.[/dim]")
+    except (requests.RequestException, OSError) as e:
+        console.print(f"[dim]Layer 1 fetch error: {e}[/dim]")
+    return b""
+
+
+def extract_main_text(raw_html: Union[str, bytes]) -> str:
+    """Primary trafilatura extraction (module-level so it can run in a worker process).
+
+    Bytes go straight in (trafilatura detects the encoding); the slower
+    fallback extractors are skipped.
+    """
+    return trafilatura.extract(raw_html, include_comments=False, include_tables=False, no_fallback=True) or ""
+
+
+# Tag-free, length-bounded capture: malformed markup can't turn a page-sized run into the "title"
+_TITLE_TAG = re.compile(r'<title>([^<]{1,500})</title>', re.IGNORECASE)
+_TITLE_TAG_BYTES = re.compile(rb'<title>([^<]{1,500})</title>', re.IGNORECASE)
+
+
+def _html_title(html: Union[str, bytes]) -> str:
+    """Text of the page's <title> tag ("" if none), searched without decoding the whole page."""
+    match = (_TITLE_TAG_BYTES if isinstance(html, bytes) else _TITLE_TAG).search(html)
+    if not match:
+        return ""
+    title = match.group(1)
+    return title.decode('utf-8', errors='replace') if isinstance(title, bytes) else title
+
+
+# Title of the stand-in item for a pasted URL until the page's own title is known
+URL_PLACEHOLDER_TITLE = 'URL Processing...'
+
+
+def url_placeholder(url: str) -> dict[str, Any]:
+    """Single news item for a direct URL; `fetch_single_article` fills in the real title."""
+    return {
+        'url': url,
+        'title': URL_PLACEHOLDER_TITLE,
+        'source': 'Direct URL',
+        'formatted_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'body': ''
+    }
 
 
 def fetch_single_article(
@@ -45,9 +125,16 @@ def fetch_single_article(
     auto_translate: bool = False, 
     do_summarize: bool = False, 
     do_sentiment: bool = False, 
-    topic: str = ""
+    topic: str = "",
+    raw_html: Optional[Union[str, bytes]] = None,
+    extracted_text: Optional[str] = None
 ) -> dict[str, Any]:
-    """Worker function: Download HTML -> Extract Text -> (Optional) Translate/Summarize/Sentiment/AI Tweet"""
+    """Worker function: Download HTML -> Extract Text -> (Optional) Translate/Summarize/Sentiment/AI Tweet
+
+    `raw_html` may carry HTML already downloaded by `enrich_news_content`; an
+    empty value means that download failed, so the session download is skipped.
+    `extracted_text` may carry the result of `extract_main_text` on it.
+    """
     url = news_item.get('url')
     news_item['full_text'] = ""
     news_item['is_translated'] = False
@@ -63,51 +150,28 @@ def fetch_single_article(
     if cached:
         news_item['full_text'] = cached
     else:
-        # Modern User-Agent headers
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
-            "Referer": "https://www.google.com/",
-        }
-        
-        extracted_text = None
-        raw_html = None
-        
-        # --- LAYER 1: Trafilatura ---
-        try:
-            raw_html = trafilatura.fetch_url(url)
-            if raw_html:
-                extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
-        except (requests.RequestException, OSError) as e:
-            console.print(f"[dim]Layer 1 fetch error: {e}[/dim]")
-            
-        # --- LAYER 2: Requests ---
-        if not extracted_text or len(extracted_text) < 200:
-            try:
-                resp = requests.get(url, headers=headers, timeout=TIMEOUT_SECONDS)
-                raw_html = resp.text
-                extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
-            except requests.exceptions.SSLError:
-                console.print(f"[dim]SSL Verify error for {url}. Switching to Layer 3 fallback.[/dim]")
-            except (requests.RequestException, OSError) as e:
-                console.print(f"[dim]Layer 2 fetch error: {e}[/dim]")
-
-        # --- LAYER 3: cURL ---
+        # --- LAYER 1: Pooled session (unless already downloaded/extracted) ---
+        if raw_html is None:
+            raw_html = download_html(url)
+        if raw_html and extracted_text is None:
+            extracted_text = extract_main_text(raw_html)
+
+        # --- LAYER 2: cURL ---
         if (not extracted_text or len(extracted_text) < 200) and shutil.which("curl") and validate_url(url):
             try:
                 cmd = [
                     "curl", "-s", "-L", 
-                    "-A", headers["User-Agent"],
+                    "-A", DEFAULT_HEADERS["User-Agent"],
                     "--max-time", str(TIMEOUT_SECONDS),
                     url
                 ]
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
+                # Raw bytes: trafilatura detects the page encoding itself, no forced UTF-8 decode
+                result = subprocess.run(cmd, capture_output=True)
                 if result.returncode == 0 and len(result.stdout) > 500:
                     raw_html = result.stdout
                     extracted_text = trafilatura.extract(raw_html, include_comments=False, include_tables=False)
             except (subprocess.SubprocessError, OSError) as e:
-                console.print(f"[dim]Layer 3 cURL error: {e}[/dim]")
+                console.print(f"[dim]Layer 2 cURL error: {e}[/dim]")
         
         # Extract metadata
         downloaded = raw_html
@@ -125,10 +189,10 @@ def fetch_single_article(
                 pass
         
         # Fallback title from <title> tag
-        if news_item.get('title') == 'URL Processing...' and downloaded:
-            match = re.search(r'<title>([^<]+)</title>', downloaded, re.IGNORECASE)
-            if match:
-                news_item['title'] = match.group(1).strip()
+        if news_item.get('title') == URL_PLACEHOLDER_TITLE and downloaded:
+            page_title = _html_title(downloaded)
+            if page_title:
+                news_item['title'] = page_title.strip()
         
         if extracted_text:
             news_item['full_text'] = extracted_text
@@ -138,6 +202,26 @@ def fetch_single_article(
     text_to_process = news_item.get('full_text', '')
     
     if text_to_process and len(text_to_process) > 100:
+        # AI title fallback: independent of do_summarize (enrich_news_content never passes it;
+        # AI there runs batched afterwards), so a title-less page doesn't stay a placeholder.
+        # Runs before translation, which would otherwise rewrite the placeholder itself, and
+        # so the generated title is translated with the text (here or in translate_articles).
+        if news_item.get('title') == URL_PLACEHOLDER_TITLE and _groq_client() is not None:
+            try:
+                from xnews.core.prompts import prompt_loader
+                system_prompt = prompt_loader.get('title_generation', 'system')
+                user_prompt_tpl = prompt_loader.get('title_generation', 'user')
+                if system_prompt and user_prompt_tpl:
+                    user_prompt = user_prompt_tpl.format(text=text_to_process[:500])
+                    t_resp = _groq_client().chat.completions.create(
+                        model=GROQ_MODEL, messages=[{"role": "user", "content": user_prompt}], max_tokens=20
+                    )
+                    generated_title = t_resp.choices[0].message.content.strip().strip('"')
+                    if generated_title:
+                        news_item['title'] = generated_title
+            except (ValueError, AttributeError, KeyError, ConnectionError) as e:
+                console.print(f"[dim]Title generation error: {e}[/dim]")
+        
         # Translation
         if auto_translate:
             text_to_process = apply_translation(news_item, text_to_process)
@@ -150,24 +234,6 @@ def fetch_single_article(
             combined = ai_generate_combined(title, text_to_process, topic)
             news_item['ai_summary'] = combined.get('summary', '')
             news_item['ai_tweet'] = combined.get('tweet', '')
-            
-            # AI Title generation fallback
-            if news_item.get('title') == 'URL Processing...' and GROQ_AVAILABLE and Groq:
-                try:
-                    from xnews.core.prompts import prompt_loader
-                    system_prompt = prompt_loader.get('title_generation', 'system')
-                    user_prompt_tpl = prompt_loader.get('title_generation', 'user')
-                    if system_prompt and user_prompt_tpl:
-                        user_prompt = user_prompt_tpl.format(text=text_to_process[:500])
-                        client = Groq(api_key=GROQ_API_KEY)
-                        t_resp = client.chat.completions.create(
-                            model=GROQ_MODEL, messages=[{"role": "user", "content": user_prompt}], max_tokens=20
-                        )
-                        generated_title = t_resp.choices[0].message.content.strip().strip('"')
-                        if generated_title:
-                            news_item['title'] = generated_title
-                except (ValueError, AttributeError, KeyError, ConnectionError) as e:
-                    console.print(f"[dim]Title generation error: {e}[/dim]")
         
         # Sentiment Analysis
         if do_sentiment:
@@ -176,6 +242,156 @@ def fetch_single_article(
     return news_item
 
 
+def _needs_download(news_item: dict[str, Any]) -> bool:
+    """True for a valid article URL whose text is not cached yet."""
+    url = news_item.get('url')
+    return bool(url) and url.startswith(('http://', 'https://')) and not cache.get(url)
+
+
+async def _download_all_async(
+    urls: list[Optional[str]],
+    on_done: Callable[[], None],
+    extract_pool: Optional[ProcessPoolExecutor] = None
+) -> list[tuple[Optional[bytes], Optional[str]]]:
+    """Download all pages concurrently over one aiohttp connection pool.
+
+    With `extract_pool`, each page goes to a worker process as soon as it
+    arrives, so extraction overlaps the downloads still in flight.
+    """
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=DEFAULT_HEADERS) as session:
+        async def _one(url: Optional[str]) -> tuple[Optional[bytes], Optional[str]]:
+            if url is None:
+                on_done()
+                return None, None
+            try:
+                async with session.get(url) as resp:
+                    html = await resp.read() if resp.status == 200 else b""
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                console.print(f"[dim]Async fetch error: {e}[/dim]")
+                html = b""
+            finally:
+                on_done()
+            
+            if not html or extract_pool is None:
+                return html, None
+            try:
+                return html, await loop.run_in_executor(extract_pool, extract_main_text, html)
+            except (OSError, BrokenProcessPool) as e:
+                # Left as None: fetch_single_article extracts it in a thread instead
+                if isinstance(e, BrokenProcessPool):
+                    _discard_extract_pool(extract_pool)
+                console.print(f"[dim]Extract worker error: {e}[/dim]")
+                return html, None
+        
+        return await asyncio.gather(*(_one(url) for url in urls))
+
+
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_FAILED = False  # creation failed once (e.g. Termux); don't retry every batch
+_extract_pool_lock = threading.Lock()
+
+
+def _get_extract_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared extraction pool, starting it on first use (None if unavailable).
+
+    Workers come from forkserver/spawn rather than fork, so they never inherit
+    locks held by this process's threads, and live until interpreter exit so
+    repeated batches don't pay process start-up again. They do import this
+    module, which is why the cache DB, Groq client and save pool are all
+    created on first use rather than at import.
+    """
+    global _EXTRACT_POOL, _EXTRACT_POOL_FAILED
+    with _extract_pool_lock:
+        if _EXTRACT_POOL is None and not _EXTRACT_POOL_FAILED and EXTRACT_PROCESSES >= 2:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            try:
+                ctx = multiprocessing.get_context(method)
+                if method == 'forkserver':
+                    # Import this module once in the server; workers fork from it ready-made
+                    ctx.set_forkserver_preload(['__main__', __name__])
+                _EXTRACT_POOL = ProcessPoolExecutor(max_workers=EXTRACT_PROCESSES, mp_context=ctx)
+                atexit.register(_EXTRACT_POOL.shutdown)
+            except (OSError, ImportError, NotImplementedError, ValueError) as e:
+                # e.g. Termux/Android has no working sem_open for multiprocessing
+                _EXTRACT_POOL_FAILED = True
+                console.print(f"[dim]Process pool unavailable, extracting in threads: {e}[/dim]")
+        return _EXTRACT_POOL
+
+
+def _discard_extract_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next batch starts a fresh one."""
+    global _EXTRACT_POOL
+    with _extract_pool_lock:
+        if _EXTRACT_POOL is pool:
+            _EXTRACT_POOL = None
+    pool.shutdown(wait=False)
+
+
+def _extract_all(pages: list[Optional[bytes]]) -> list[Optional[str]]:
+    """Run the CPU-bound primary extraction across worker processes.
+
+    Entries left as None are extracted later by `fetch_single_article`
+    (nothing to extract, too little work for a pool, or no pool available).
+    """
+    texts: list[Optional[str]] = [None] * len(pages)
+    jobs = [i for i, html in enumerate(pages) if html]
+    pool = _get_extract_pool() if len(jobs) >= 2 else None
+    if pool is None:
+        return texts
+    
+    try:
+        for i, text in zip(jobs, pool.map(extract_main_text, [pages[i] for i in jobs])):
+            texts[i] = text
+    except (OSError, BrokenProcessPool) as e:
+        if isinstance(e, BrokenProcessPool):
+            _discard_extract_pool(pool)
+        console.print(f"[dim]Extract worker error, extracting in threads: {e}[/dim]")
+    return texts
+
+
+def _download_and_extract(
+    urls: list[Optional[str]],
+    on_done: Callable[[], None]
+) -> tuple[list[Optional[bytes]], list[Optional[str]]]:
+    """Download all pages (None entries are skipped) and run primary extraction.
+
+    With aiohttp the two stages are pipelined on a private event loop; otherwise
+    (or when called from inside a running loop, where asyncio.run can't nest)
+    pages are downloaded in threads and extracted once all of them are in.
+    """
+    if sum(1 for url in urls if url) <= 1:
+        # Nothing to overlap: skip the event loop, executors and process pool
+        pages = []
+        for url in urls:
+            pages.append(download_html(url) if url else None)
+            on_done()
+        return pages, [None] * len(urls)
+    
+    try:
+        asyncio.get_running_loop()
+        in_event_loop = True
+    except RuntimeError:
+        in_event_loop = False
+    
+    if not AIOHTTP_AVAILABLE or in_event_loop:
+        def _one(url: Optional[str]) -> Optional[bytes]:
+            try:
+                return download_html(url) if url else None
+            finally:
+                on_done()
+        
+        with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
+            pages = list(executor.map(_one, urls))
+        return pages, _extract_all(pages)
+    
+    results = asyncio.run(_download_all_async(urls, on_done, _get_extract_pool()))
+    return [html for html, _ in results], [text for _, text in results]
+
+
 def enrich_news_content(
     news_list: list[dict[str, Any]], 
     do_translate: bool = False, 
@@ -210,33 +426,81 @@ def enrich_news_content(
         TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("Processing articles...", total=len(news_list))
+        download_task = progress.add_task("Downloading articles...", total=len(news_list))
+        process_task = progress.add_task("Extracting text...", total=len(news_list))
         
-        with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
-            future_to_news = {
-                executor.submit(fetch_single_article, item, do_translate, do_summarize, do_sentiment, topic): item 
-                for item in news_list
-            }
-            
-            for future in as_completed(future_to_news):
-                try:
-                    data = future.result()
-                    enriched_results.append(data)
-                except (OSError, RuntimeError) as e:
-                    console.print(f"[dim]Article fetch error: {e}[/dim]")
-                    item = future_to_news[future]
-                    item['full_text'] = ""
-                    enriched_results.append(item)
-                progress.update(task, advance=1)
+        # Phase 1: download (I/O, asyncio) feeding extract (CPU, processes) -> fallbacks/metadata/cache (threads).
+        # Translation, sentiment and AI run afterwards in bulk.
+        urls = [item['url'] if _needs_download(item) else None for item in news_list]
+        pages, texts = _download_and_extract(urls, lambda: progress.update(download_task, advance=1))
+        
+        def _finish(job: tuple[dict[str, Any], Optional[bytes], Optional[str]]) -> dict[str, Any]:
+            item, html, text = job
+            try:
+                return fetch_single_article(item, False, False, False, topic, html, text)
+            except (OSError, RuntimeError) as e:
+                console.print(f"[dim]Article fetch error: {e}[/dim]")
+                item['full_text'] = ""
+                return item
+            finally:
+                progress.update(process_task, advance=1)
+        
+        jobs = list(zip(news_list, pages, texts))
+        if len(jobs) == 1:
+            # Single article (direct URL): no pool to set up
+            enriched_results = [_finish(jobs[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_THREADS, len(jobs))) as executor:
+                enriched_results = list(executor.map(_finish, jobs))
+        
+        # Raw HTML is the bulk of the per-article memory; drop it before the slow AI/translate phases
+        del jobs, pages, texts
+    
+    # Phase 2: translate all titles + paragraphs in a few packed requests
+    if do_translate:
+        with console.status("[bold cyan]🌐 Translate:[/bold cyan] menerjemahkan artikel..."):
+            translate_articles(enriched_results)
+    
+    # Phase 3: sentiment on the final (possibly translated) text
+    if do_sentiment:
+        for item in enriched_results:
+            if len(item.get('full_text') or '') > 100:
+                item['sentiment'] = analyze_sentiment(item['full_text'])
+    
+    # AI Summary + Tweet (batched: several articles per API call)
+    if do_summarize:
+        with console.status("[bold cyan]🧠 AI:[/bold cyan] membuat ringkasan & draft tweet..."):
+            ai_batch_process(enriched_results, topic)
     
     return enriched_results
 
 
+@lru_cache(maxsize=4096)
+def _parse_pub_date(date_str: str) -> datetime:
+    """Parse a result date; memoized since watch mode sees the same strings every tick."""
+    # Fast path: DDG dates are ISO-8601; dateutil only for anything else
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return parser.parse(date_str)
+
+
+# Full-title similarity a same-source/day/prefix signature match still needs: well below
+# TitleIndex's bar (re-edited headlines), above recurring formats like "Stock market today: ..."
+_SIGNATURE_MIN_RATIO = 0.8
+
+
 def filter_recent_news(news_list: list[dict[str, Any]], days: int = 2) -> list[dict[str, Any]]:
     """Filter news to recent items and remove duplicates."""
     recent_news: list[dict[str, Any]] = []
-    seen_titles: set[str] = set()
-    cutoff_date = datetime.now().astimezone() - timedelta(days=days)
+    seen_titles = TitleIndex()
+    # Second layer: same outlet, same day, same headline opening (re-edited headlines)
+    seen_signatures: dict[tuple[str, Any, str], list[str]] = {}
+    now_local = datetime.now().astimezone()
+    local_tz = now_local.tzinfo
+    cutoff_date = now_local - timedelta(days=days)
+    # Cheap string prefilter for ISO dates; one day of slack covers timezone offsets
+    cutoff_prefix = (cutoff_date - timedelta(days=1)).strftime('%Y-%m-%d')
     
     console.print("[dim]Menyaring berita terbaru & menghapus duplikat...[/dim]")
     
@@ -244,35 +508,52 @@ def filter_recent_news(news_list: list[dict[str, Any]], days: int = 2) -> list[d
         date_str = item.get('date')
         if not date_str:
             continue
+        if isinstance(date_str, str) and date_str[4:5] == '-' and date_str[:10] < cutoff_prefix:
+            continue
         try:
-            pub_date = parser.parse(date_str)
+            pub_date = _parse_pub_date(date_str)
             if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=datetime.now().astimezone().tzinfo)
+                pub_date = pub_date.replace(tzinfo=local_tz)
             if pub_date >= cutoff_date:
-                if is_duplicate(item, seen_titles):
+                title = clean_title(item.get('title', ''))
+                signature = (item.get('source', ''), pub_date.date(), title[:40])
+                if is_duplicate(item, seen_titles) or any(
+                    title_ratio(title, earlier) >= _SIGNATURE_MIN_RATIO
+                    for earlier in seen_signatures.get(signature, ())
+                ):
                     continue
-                seen_titles.add(clean_title(item.get('title', '')))
+                seen_signatures.setdefault(signature, []).append(title)
+                seen_titles.add(title)
                 item['_raw_date'] = pub_date
-                item['formatted_date'] = pub_date.strftime('%Y-%m-%d %H:%M:%S')
+                item['formatted_date'] = pub_date.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
                 item['body'] = item.get('body', '')
                 recent_news.append(item)
         except (ValueError, TypeError):
             continue
     
-    recent_news.sort(key=lambda x: x.get('_raw_date', datetime.min), reverse=True)
+    recent_news.sort(key=lambda x: x['_raw_date'], reverse=True)
     return recent_news
 
 
-def search_topic(topic: str, region: str = 'wt-wt', max_results: int = 50) -> list[dict[str, Any]]:
-    """Search for news on a topic using DuckDuckGo."""
+def search_topic(
+    topic: str,
+    region: str = 'wt-wt',
+    max_results: int = 50,
+    max_age: Optional[float] = None
+) -> list[dict[str, Any]]:
+    """Search for news on a topic using DuckDuckGo.
+
+    `max_age` (seconds) bounds how stale a cached result may be.
+    """
     console.print(f"\n[bold green]🔍 Mencari:[/bold green] '{topic}'")
     
-    # Check cache
-    cache_key = f"search_{topic}_{region}_{max_results}"
-    cached = cache.get(cache_key)
+    # Check cache (case/spacing variants of a retyped query share one entry; DDG ignores both)
+    cache_key = f"search_{' '.join(topic.split()).casefold()}_{region}_{max_results}"
+    cached = cache.get(cache_key, max_age=max_age)
     if cached:
         console.print("[dim]📦 Menggunakan cache...[/dim]")
-        return cached
+        # Served from the in-memory LRU: hand out copies, callers mutate the items
+        return [dict(r) for r in cached]
     
     results: list[dict[str, Any]] = []
     attempt = 0
@@ -298,6 +579,6 @@ def search_topic(topic: str, region: str = 'wt-wt', max_results: int = 50) -> li
                 time.sleep(wait_time)
     
     if results:
-        cache.set(cache_key, results)
+        cache.set(cache_key, [dict(r) for r in results])
     
     return results
@@ -4,6 +4,7 @@ Loads and manages AI prompts from YAML file.
 """
 
 import os
+import importlib.util
 from typing import Any, Optional
 
 from rich.console import Console
@@ -12,12 +13,8 @@ from xnews.config import PROMPT_FILE
 
 console = Console()
 
-# YAML Support
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# YAML Support (imported when the prompt file is first needed)
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 
 class PromptLoader:
@@ -25,7 +22,14 @@ class PromptLoader:
     
     def __init__(self, filepath: str = PROMPT_FILE) -> None:
         self.filepath: str = filepath
-        self.prompts: dict[str, Any] = self._load_prompts()
+        self._prompts: Optional[dict[str, Any]] = None
+
+    @property
+    def prompts(self) -> dict[str, Any]:
+        """Prompt tree, parsed on first use so runs without AI never read it."""
+        if self._prompts is None:
+            self._prompts = self._load_prompts()
+        return self._prompts
 
     def _load_prompts(self) -> dict[str, Any]:
         if not YAML_AVAILABLE:
@@ -35,6 +39,7 @@ class PromptLoader:
             console.print(f"[yellow]Warning: {self.filepath} not found. Using internal defaults.[/yellow]")
             return {}
             
+        import yaml
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f) or {}
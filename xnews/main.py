@@ -9,7 +9,7 @@ For backward compatibility, the original news_fetcher.py is preserved.
 import argparse
 import sys
 import time
-from datetime import datetime
+from functools import partial
 
 from rich.console import Console
 from rich.panel import Panel
@@ -23,25 +23,32 @@ from xnews.config import (
 )
 from xnews.core.cache import cache
 from xnews.core.fetcher import (
-    search_topic, filter_recent_news, enrich_news_content, fetch_single_article
+    search_topic, filter_recent_news, enrich_news_content, fetch_single_article, url_placeholder
 )
 from xnews.ai.providers import ai_generate_tweet_text, GROQ_AVAILABLE, GEMINI_AVAILABLE
-from xnews.utils.export import save_to_csv, save_to_json, save_to_markdown, generate_tweet_url
-from xnews.utils.text import get_relevant_emoji
+from xnews.utils.export import save_to_csv, save_to_json, save_to_markdown, save_reports, generate_tweet_url
+from xnews.utils.text import get_relevant_emoji, safe_filename
 
 console = Console()
 
 
-def print_banner() -> None:
-    """Print application banner."""
-    banner = """
+# Banner panel is built once and reused on every print
+_BANNER_PANEL = Panel(
+    """
 ╔══════════════════════════════════════════════════════════════╗
 ║     🚀 XNEWS - Smart News Fetcher Turbo v2.0                 ║
 ║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━      ║
 ║     ✨ AI Summarization • Sentiment Analysis • Rich UI       ║
 ╚══════════════════════════════════════════════════════════════╝
-    """
-    console.print(Panel(banner.strip(), style="bold cyan", box=box.DOUBLE))
+    """.strip(),
+    style="bold cyan",
+    box=box.DOUBLE
+)
+
+
+def print_banner() -> None:
+    """Print application banner."""
+    console.print(_BANNER_PANEL)
 
 
 def ai_settings_menu() -> None:
@@ -189,13 +196,15 @@ def interactive_mode() -> None:
             console.print("\n[bold]Save:[/bold] [c]CSV [j]JSON [m]Markdown [n]Skip")
             save_opt = console.input("[bold]> [/bold]").strip().lower()
             
-            safe_topic = query.replace(' ', '_')[:20]
+            safe_topic = safe_filename(query, 20)
+            jobs = []
             if 'c' in save_opt:
-                save_to_csv(enriched, f"{safe_topic}_news.csv")
+                jobs.append(partial(save_to_csv, enriched, f"{safe_topic}_news.csv"))
             if 'j' in save_opt:
-                save_to_json(enriched, f"{safe_topic}_news.json")
+                jobs.append(partial(save_to_json, enriched, f"{safe_topic}_news.json"))
             if 'm' in save_opt:
-                save_to_markdown(enriched, f"{safe_topic}_news.md", query)
+                jobs.append(partial(save_to_markdown, enriched, f"{safe_topic}_news.md", query))
+            save_reports(*jobs)
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]👋 Interrupted. Bye![/yellow]")
@@ -218,6 +227,7 @@ def main() -> None:
     parser.add_argument('--json', '-j', action='store_true', help='Export to JSON')
     parser.add_argument('--csv', '-c', action='store_true', help='Export to CSV')
     parser.add_argument('--markdown', '-m', action='store_true', help='Export to Markdown')
+    parser.add_argument('--compress', action='store_true', help='Gzip CSV/JSON exports')
     parser.add_argument('--limit', '-l', type=int, default=10, help='Max results')
     parser.add_argument('--watch', '-w', action='store_true', help='Watch mode')
     parser.add_argument('--interval', '-i', type=int, default=30, help='Watch interval (minutes)')
@@ -241,14 +251,8 @@ def main() -> None:
     if args.url:
         print_banner()
         console.print(f"[bold]🔗 Processing URL:[/bold] {args.url}")
-        news_item = {
-            'url': args.url,
-            'title': 'URL Processing...',
-            'source': 'Direct URL',
-            'formatted_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
         result = fetch_single_article(
-            news_item, 
+            url_placeholder(args.url), 
             auto_translate=args.translate,
             do_summarize=args.summary,
             do_sentiment=args.sentiment,
@@ -289,13 +293,15 @@ def main() -> None:
             console.print(f"   [green]→ {news.get('ai_summary')}[/green]")
     
     # Export
-    safe_topic = args.topic.replace(' ', '_')[:20]
+    safe_topic = safe_filename(args.topic, 20)
+    jobs = []
     if args.json:
-        save_to_json(enriched, f"{safe_topic}_news.json")
+        jobs.append(partial(save_to_json, enriched, f"{safe_topic}_news.json", args.compress))
     if args.csv:
-        save_to_csv(enriched, f"{safe_topic}_news.csv")
+        jobs.append(partial(save_to_csv, enriched, f"{safe_topic}_news.csv", args.compress))
     if args.markdown:
-        save_to_markdown(enriched, f"{safe_topic}_news.md", args.topic)
+        jobs.append(partial(save_to_markdown, enriched, f"{safe_topic}_news.md", args.topic))
+    save_reports(*jobs)
 
 
 if __name__ == "__main__":
@@ -3,35 +3,63 @@ xnews - Text Utilities Module
 Translation, sentiment analysis, and text processing utilities.
 """
 
+import re
+import zlib
 import difflib
+import importlib.util
+import random
+import threading
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Optional
 
 from rich.console import Console
 
-from xnews.config import TextLimits
+from xnews.config import TRANSLATE_WORKERS, TextLimits
 
 console = Console()
 
 # --- Sentiment Analysis ---
 try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    VADER_AVAILABLE = True
 except ImportError:
-    TEXTBLOB_AVAILABLE = False
+    VADER_AVAILABLE = False
+
+# TextBlob pulls in NLTK; it is only imported if VADER is missing and sentiment is requested
+TEXTBLOB_AVAILABLE = importlib.util.find_spec("textblob") is not None
+
+# --- Fuzzy Matching ---
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # --- Translation ---
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import BaseError as TranslatorError
+
+
+@lru_cache(maxsize=None)
+def _vader() -> Any:
+    """Shared VADER analyzer; its lexicon is parsed on the first sentiment call."""
+    return SentimentIntensityAnalyzer()
 
 
 def analyze_sentiment(text: str) -> dict[str, Any]:
-    """Analyze sentiment of text using TextBlob."""
-    if not TEXTBLOB_AVAILABLE or not text:
+    """Analyze sentiment of text (VADER lexicon scan, TextBlob as fallback)."""
+    if not (VADER_AVAILABLE or TEXTBLOB_AVAILABLE) or not text:
         return {"label": "Unknown", "score": 0.0, "emoji": "❓"}
     
     try:
-        blob = TextBlob(text[:TextLimits.SENTIMENT_SAMPLE])
-        polarity = blob.sentiment.polarity
+        if VADER_AVAILABLE:
+            polarity = _vader().polarity_scores(text[:TextLimits.SENTIMENT_SAMPLE])['compound']
+        else:
+            from textblob import TextBlob
+            polarity = TextBlob(text[:TextLimits.SENTIMENT_SAMPLE]).sentiment.polarity
         
         if polarity > 0.1:
             return {"label": "Positif", "score": polarity, "emoji": "😊"}
@@ -44,57 +72,226 @@ def analyze_sentiment(text: str) -> dict[str, Any]:
         return {"label": "Unknown", "score": 0.0, "emoji": "❓"}
 
 
-def translate_text(text: str, target: str = 'id') -> str:
-    """Translate long text by splitting into paragraphs."""
-    if not text:
-        return ""
-    
-    translator = GoogleTranslator(source='auto', target=target)
-    translated_parts: list[str] = []
-    paragraphs = text.split('\n')
+_translator_local = threading.local()
+
+
+def get_translator(target: str = 'id') -> GoogleTranslator:
+    """Return a cached GoogleTranslator for `target`, one per thread.
+
+    GoogleTranslator mutates its request params on every call, so instances
+    are reused within a thread but never shared between worker threads.
+    """
+    translators: Optional[dict[str, GoogleTranslator]] = getattr(_translator_local, 'translators', None)
+    if translators is None:
+        translators = _translator_local.translators = {}
+    if target not in translators:
+        translators[target] = GoogleTranslator(source='auto', target=target)
+    return translators[target]
+
+
+# requests errors derive from OSError (not the builtin ConnectionError); deep_translator
+# raises its own BaseError subclasses. Either way the text stays untranslated.
+_TRANSLATE_ERRORS = (OSError, ValueError, TranslatorError)
+
+
+def translate_many(texts: list[str], target: str = 'id') -> list[str]:
+    """Translate many short texts with as few requests as possible.
+
+    Lines are packed into newline-joined requests of up to
+    `TextLimits.TRANSLATION_CHUNK` characters and split back afterwards.
+    If a packed response does not come back with the same number of lines,
+    that pack falls back to one request per line. Packs are sent in parallel
+    (bounded by TRANSLATE_WORKERS).
+    """
+    results = list(texts)
     
-    for p in paragraphs:
-        if not p.strip():
-            translated_parts.append("")
-            continue
+    def _translate_one(idx: int) -> None:
         try:
-            if len(p) > TextLimits.TRANSLATION_CHUNK:
-                res = translator.translate(p[:TextLimits.TRANSLATION_CHUNK])
-            else:
-                res = translator.translate(p)
-            translated_parts.append(res)
-        except (ValueError, ConnectionError, TimeoutError) as e:
+            # Translators are thread-local, so fetch the one for this worker
+            results[idx] = get_translator(target).translate(texts[idx][:TextLimits.TRANSLATION_CHUNK])
+        except _TRANSLATE_ERRORS as e:
             console.print(f"[dim]Translation skipped: {e}[/dim]")
-            translated_parts.append(p)
     
-    return "\n".join(translated_parts)
+    def _translate_pack(indices: list[int]) -> None:
+        if len(indices) == 1:
+            _translate_one(indices[0])
+            return
+        try:
+            joined = "\n".join(texts[i] for i in indices)
+            parts = (get_translator(target).translate(joined) or "").split("\n")
+        except _TRANSLATE_ERRORS:
+            parts = []
+        if len(parts) == len(indices):
+            for i, part in zip(indices, parts):
+                results[i] = part
+        else:
+            for i in indices:
+                _translate_one(i)
+    
+    jobs: list[list[int]] = []
+    pack: list[int] = []
+    pack_len = 0
+    for idx, text in enumerate(texts):
+        if not text.strip():
+            continue
+        if "\n" in text or len(text) > TextLimits.TRANSLATION_CHUNK:
+            jobs.append([idx])
+            continue
+        if pack and pack_len + len(text) + 1 > TextLimits.TRANSLATION_CHUNK:
+            jobs.append(pack)
+            pack, pack_len = [], 0
+        pack.append(idx)
+        pack_len += len(text) + 1
+    if pack:
+        jobs.append(pack)
+    
+    if len(jobs) == 1:
+        _translate_pack(jobs[0])
+    elif jobs:
+        with ThreadPoolExecutor(max_workers=min(TRANSLATE_WORKERS, len(jobs))) as executor:
+            list(executor.map(_translate_pack, jobs))
+    
+    return results
+
+
+def translate_text(text: str, target: str = 'id') -> str:
+    """Translate long text by splitting into paragraphs."""
+    if not text:
+        return ""
+    return "\n".join(translate_many(text.split('\n'), target=target))
 
 
 def apply_translation(news_item: dict[str, Any], text: str, target: str = 'id') -> str:
     """Helper to translate title and text."""
-    try:
-        orig_title = news_item.get('title', '')
-        if orig_title:
-            news_item['title'] = GoogleTranslator(source='auto', target=target).translate(orig_title)
-    except (ValueError, ConnectionError, TimeoutError):
-        pass  # Keep original title on translation failure
-    return translate_text(text, target=target)
+    orig_title = news_item.get('title', '')
+    translated = translate_many([orig_title.replace('\n', ' ')] + text.split('\n'), target=target)
+    if orig_title:
+        news_item['title'] = translated[0]
+    return "\n".join(translated[1:])
+
+
+def translate_articles(news_list: list[dict[str, Any]], target: str = 'id') -> None:
+    """Translate titles and full texts of many articles in a few packed requests."""
+    items = [n for n in news_list if len(n.get('full_text') or '') > 100]
+    if not items:
+        return
+    
+    lines: list[str] = []
+    spans: list[tuple[int, int]] = []
+    for item in items:
+        lines.append(item.get('title', '').replace('\n', ' '))
+        paragraphs = item['full_text'].split('\n')
+        spans.append((len(lines), len(lines) + len(paragraphs)))
+        lines.extend(paragraphs)
+    
+    translated = translate_many(lines, target=target)
+    for item, (start, end) in zip(items, spans):
+        if item.get('title'):
+            item['title'] = translated[start - 1]
+        item['full_text'] = "\n".join(translated[start:end])
+        item['is_translated'] = True
+
+
+_TITLE_PUNCT = re.compile(r'\W+')
 
 
 def clean_title(title: str) -> str:
-    """Normalize title for comparison."""
-    return title.lower().strip()
+    """Normalize title for comparison (case and punctuation insensitive)."""
+    return _TITLE_PUNCT.sub(' ', title.lower()).strip()
 
 
-def is_duplicate(news_item: dict[str, Any], existing_titles: set[str], threshold: float = 0.85) -> bool:
-    """Check if news item is duplicate based on title similarity."""
-    title = clean_title(news_item.get('title', ''))
-    if title in existing_titles:
-        return True
-    for existing in existing_titles:
-        if difflib.SequenceMatcher(None, title, existing).ratio() > threshold:
+_UNSAFE_FILENAME_CHARS = re.compile(r'\W')
+_ASCII_FILENAME_TABLE = bytes(c if chr(c).isalnum() else ord('_') for c in range(256))
+
+
+def safe_filename(text: str, limit: int = 30) -> str:
+    """Replace every non-alphanumeric character with '_' for use in report filenames."""
+    text = text[:limit]
+    if text.isascii():
+        # Table lookup in one C pass; the regex is only needed for non-ASCII letters
+        return text.encode('ascii').translate(_ASCII_FILENAME_TABLE).decode('ascii')
+    return _UNSAFE_FILENAME_CHARS.sub('_', text)
+
+
+# --- Near-Duplicate Detection (MinHash + LSH) ---
+_SHINGLE_SIZE = 4
+_NUM_PERM = 64
+_LSH_BANDS = 16
+_LSH_ROWS = _NUM_PERM // _LSH_BANDS
+_HASH_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [(_rng.randrange(1, _HASH_PRIME), _rng.randrange(0, _HASH_PRIME)) for _ in range(_NUM_PERM)]
+
+
+def _minhash_signature(title: str) -> tuple[int, ...]:
+    """Compute a MinHash signature over character shingles of a title."""
+    shingles = {title[i:i + _SHINGLE_SIZE] for i in range(max(len(title) - _SHINGLE_SIZE + 1, 1))}
+    # crc32 rather than hash(): str hashing is salted per process, signatures must be stable
+    hashes = [zlib.crc32(sh.encode()) for sh in shingles]
+    return tuple(min((a * h + b) % _HASH_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def title_ratio(a: str, b: str) -> float:
+    """Similarity of two cleaned titles on difflib's 0..1 scale (rapidfuzz's C++ Indel ratio if installed)."""
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(a, b) / 100
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+class TitleIndex:
+    """Near-duplicate title index using MinHash signatures with LSH banding.
+
+    Each lookup only compares against titles sharing at least one LSH band,
+    so dedup stays roughly linear instead of comparing every pair.
+    """
+
+    def __init__(self, threshold: float = 0.85) -> None:
+        self.threshold: float = threshold
+        self.exact: set[str] = set()
+        self.titles: list[str] = []
+        self.signatures: list[tuple[int, ...]] = []
+        self.buckets: defaultdict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+        self._last: tuple[str, tuple[int, ...]] = ("", ())
+
+    def _signature(self, title: str) -> tuple[int, ...]:
+        if self._last[0] != title or not self._last[1]:
+            self._last = (title, _minhash_signature(title))
+        return self._last[1]
+
+    @staticmethod
+    def _bands(sig: tuple[int, ...]):
+        for b in range(_LSH_BANDS):
+            yield (b, sig[b * _LSH_ROWS:(b + 1) * _LSH_ROWS])
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def is_duplicate(self, title: str) -> bool:
+        if title in self.exact:
             return True
-    return False
+        sig = self._signature(title)
+        candidates: set[int] = set()
+        for band in self._bands(sig):
+            candidates.update(self.buckets.get(band, ()))
+        # MinHash agreement runs well below difflib's ratio on retyped headlines (one inserted
+        # word), so it only picks candidates; the verdict stays on difflib's scale
+        return any(title_ratio(title, self.titles[idx]) > self.threshold for idx in candidates)
+
+    def add(self, title: str) -> None:
+        if title in self.exact:
+            return
+        self.exact.add(title)
+        sig = self._signature(title)
+        idx = len(self.signatures)
+        self.titles.append(title)
+        self.signatures.append(sig)
+        for band in self._bands(sig):
+            self.buckets[band].append(idx)
+
+
+def is_duplicate(news_item: dict[str, Any], existing_titles: TitleIndex) -> bool:
+    """Check if news item is duplicate based on title similarity."""
+    return existing_titles.is_duplicate(clean_title(news_item.get('title', '')))
 
 
 def validate_url(url: str) -> bool:
@@ -126,6 +323,44 @@ def validate_url(url: str) -> bool:
         return False
 
 
+# Topic keyword rules in priority order, each compiled into a single regex
+_TOPIC_EMOJI_RULES: list[tuple[re.Pattern, str]] = [
+    (re.compile(pattern), icon) for pattern, icon in [
+        ('ai|tech|robot|data|cyber|app|soft|hard', "🤖"),
+        ('saham|uang|bisnis|ekonomi|market|stock|profit|crypto|bitcoin|btc|invest', "💰"),
+        ('sehat|dokter|virus|obat|medis', "🏥"),
+        ('game|play|esport', "🎮"),
+        ('politik|presiden|hukum|negara|dpr|mpr|partai', "⚖️"),
+    ]
+]
+
+_COUNTRY_FLAGS: dict[str, str] = {
+    'indonesia': '🇮🇩', 'jakarta': '🇮🇩', 'rupiah': '🇮🇩', 'jokowi': '🇮🇩', 'prabowo': '🇮🇩',
+    'amerika': '🇺🇸', 'usa': '🇺🇸', 'united states': '🇺🇸', 'biden': '🇺🇸', 'trump': '🇺🇸', 'dollar': '🇺🇸',
+    'china': '🇨🇳', 'tiongkok': '🇨🇳', 'beijing': '🇨🇳', 'xi jinping': '🇨🇳', 'yuan': '🇨🇳',
+    'jepang': '🇯🇵', 'japan': '🇯🇵', 'tokyo': '🇯🇵', 'yen': '🇯🇵',
+    'korea': '🇰🇷', 'seoul': '🇰🇷', 'k-pop': '🇰🇷',
+    'rusia': '🇷🇺', 'russia': '🇷🇺', 'moskow': '🇷🇺', 'putin': '🇷🇺',
+    'ukraina': '🇺🇦', 'ukraine': '🇺🇦', 'kiev': '🇺🇦', 'kyiv': '🇺🇦',
+    'inggris': '🇬🇧', 'uk': '🇬🇧', 'london': '🇬🇧',
+    'eropa': '🇪🇺', 'europe': '🇪🇺', 'eu': '🇪🇺',
+    'palestina': '🇵🇸', 'gaza': '🇵🇸', 'hamas': '🇵🇸',
+    'israel': '🇮🇱', 'tel aviv': '🇮🇱',
+    'arab': '🇸🇦', 'saudi': '🇸🇦', 'mekkah': '🇸🇦',
+    'malaysia': '🇲🇾', 'kuala lumpur': '🇲🇾',
+    'singapura': '🇸🇬', 'singapore': '🇸🇬',
+    'india': '🇮🇳', 'new delhi': '🇮🇳',
+    'jerman': '🇩🇪', 'germany': '🇩🇪',
+    'prancis': '🇫🇷', 'france': '🇫🇷'
+}
+# Longest keywords first so e.g. 'united states' wins over shorter overlaps. Matches
+# don't overlap, so a short key inside a longer one ('uk' in 'ukraina') no longer
+# adds its own flag the way the old per-keyword 'in' checks did.
+_COUNTRY_PATTERN = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_COUNTRY_FLAGS, key=len, reverse=True))
+)
+
+
 def get_relevant_emoji(text: str) -> str:
     """Select emoji based on topic and country keywords."""
     text = text.lower()
@@ -133,47 +368,15 @@ def get_relevant_emoji(text: str) -> str:
 
     # Topic Emoji
     topic_icon = "📢"
-    if any(k in text for k in ['ai', 'tech', 'robot', 'data', 'cyber', 'app', 'soft', 'hard']):
-        topic_icon = "🤖"
-    elif any(k in text for k in ['saham', 'uang', 'bisnis', 'ekonomi', 'market', 'stock', 'profit', 'crypto', 'bitcoin', 'btc', 'invest']):
-        topic_icon = "💰"
-    elif any(k in text for k in ['sehat', 'dokter', 'virus', 'obat', 'medis']):
-        topic_icon = "🏥"
-    elif any(k in text for k in ['game', 'play', 'esport']):
-        topic_icon = "🎮"
-    elif any(k in text for k in ['politik', 'presiden', 'hukum', 'negara', 'dpr', 'mpr', 'partai']):
-        topic_icon = "⚖️"
-    
+    for pattern, icon in _TOPIC_EMOJI_RULES:
+        if pattern.search(text):
+            topic_icon = icon
+            break
     emojis.append(topic_icon)
 
-    # Country Flags
-    country_map = {
-        'indonesia': '🇮🇩', 'jakarta': '🇮🇩', 'rupiah': '🇮🇩', 'jokowi': '🇮🇩', 'prabowo': '🇮🇩',
-        'amerika': '🇺🇸', 'usa': '🇺🇸', 'united states': '🇺🇸', 'biden': '🇺🇸', 'trump': '🇺🇸', 'dollar': '🇺🇸',
-        'china': '🇨🇳', 'tiongkok': '🇨🇳', 'beijing': '🇨🇳', 'xi jinping': '🇨🇳', 'yuan': '🇨🇳',
-        'jepang': '🇯🇵', 'japan': '🇯🇵', 'tokyo': '🇯🇵', 'yen': '🇯🇵',
-        'korea': '🇰🇷', 'seoul': '🇰🇷', 'k-pop': '🇰🇷',
-        'rusia': '🇷🇺', 'russia': '🇷🇺', 'moskow': '🇷🇺', 'putin': '🇷🇺',
-        'ukraina': '🇺🇦', 'ukraine': '🇺🇦', 'kiev': '🇺🇦', 'kyiv': '🇺🇦',
-        'inggris': '🇬🇧', 'uk': '🇬🇧', 'london': '🇬🇧',
-        'eropa': '🇪🇺', 'europe': '🇪🇺', 'eu': '🇪🇺',
-        'palestina': '🇵🇸', 'gaza': '🇵🇸', 'hamas': '🇵🇸',
-        'israel': '🇮🇱', 'tel aviv': '🇮🇱',
-        'arab': '🇸🇦', 'saudi': '🇸🇦', 'mekkah': '🇸🇦',
-        'malaysia': '🇲🇾', 'kuala lumpur': '🇲🇾',
-        'singapura': '🇸🇬', 'singapore': '🇸🇬',
-        'india': '🇮🇳', 'new delhi': '🇮🇳',
-        'jerman': '🇩🇪', 'germany': '🇩🇪',
-        'prancis': '🇫🇷', 'france': '🇫🇷'
-    }
-
-    found_flags: set[str] = set()
-    for keyword, flag in country_map.items():
-        if keyword in text:
-            found_flags.add(flag)
-    
+    # Country Flags (single pass over the text)
+    found_flags: set[str] = {_COUNTRY_FLAGS[m.group(0)] for m in _COUNTRY_PATTERN.finditer(text)}
     if found_flags:
-        sorted_flags = sorted(list(found_flags))
-        emojis.extend(sorted_flags[:2])
+        emojis.extend(sorted(found_flags)[:2])
 
     return " ".join(emojis)